@@ -16,7 +16,6 @@ def main():
     game = Game(SCREEN_WIDTH, SCREEN_HEIGHT)
     
     # Game loop
-    clock = pygame.time.Clock()
     while True:
         # Handle events
         for event in pygame.event.get():
@@ -36,12 +35,9 @@ def main():
         # Update game state
         game.update()
         
-        # Draw everything
+        # Draw everything; game.draw presents (dirty rects or a full
+        # flip as needed) and caps the frame rate itself
         game.draw()
-        pygame.display.flip()
-        
-        # Cap the frame rate
-        clock.tick(60)
 
 if __name__ == "__main__":
     main()
@@ -54,6 +54,7 @@ Performance Features:
 import pygame
 import random
 import math
+from collections import deque
 from typing import List, Dict, Tuple, Optional
 
 
@@ -97,15 +98,14 @@ class Particle:
         self.gravity = gravity
         self.fade = fade
         self.glow = glow
-        self.trail: List[Tuple[float, float]] = []
+        # deque discards the oldest point in O(1) instead of list.pop(0)
+        self.trail: deque = deque(maxlen=trail_length)
         self.trail_length = trail_length
 
     def update(self) -> bool:
-        # Update trail
+        # Update trail; the bounded deque drops the oldest point itself
         if self.trail_length > 0:
             self.trail.append((self.x, self.y))
-            if len(self.trail) > self.trail_length:
-                self.trail.pop(0)
 
         # Update position
         self.x += self.dx
@@ -262,10 +262,18 @@ class ParticleSystem:
         self.particles = [p for p in self.particles if p.update()]
 
     def draw(self, screen, camera_offset=(0, 0)):
-        """Draw all particles with camera offset."""
+        """Draw all particles with camera offset.
+
+        Returns a screen-space bounding rect of everything drawn, or None
+        when there was nothing to draw.
+        """
         # Unpack camera offset
         offset_x, offset_y = camera_offset
 
+        # Track drawn extents for dirty-rect presentation
+        min_x = min_y = float("inf")
+        max_x = max_y = float("-inf")
+
         # Draw permanent decals first (they should be under everything else)
         for decal in self.permanent_decals:
             screen_x = int(decal["x"] - offset_x)
@@ -284,10 +292,40 @@ class ParticleSystem:
             screen.blit(
                 decal_surf, (screen_x - decal["size"], screen_y - decal["size"])
             )
+            min_x = min(min_x, screen_x - decal["size"])
+            min_y = min(min_y, screen_y - decal["size"])
+            max_x = max(max_x, screen_x + decal["size"])
+            max_y = max(max_y, screen_y + decal["size"])
 
         # Draw active particles
         for particle in self.particles:
             particle.draw(screen, offset_x, offset_y)
+            px = particle.x - offset_x
+            py = particle.y - offset_y
+            min_x = min(min_x, px)
+            min_y = min(min_y, py)
+            max_x = max(max_x, px)
+            max_y = max(max_y, py)
+            # Trail points lag well behind fast particles, so fold them
+            # into the extents rather than relying on the margin
+            for trail_x, trail_y in particle.trail:
+                tx = trail_x - offset_x
+                ty = trail_y - offset_y
+                min_x = min(min_x, tx)
+                min_y = min(min_y, ty)
+                max_x = max(max_x, tx)
+                max_y = max(max_y, ty)
+
+        if min_x > max_x:
+            return None
+        # Pad for particle size, glow and trails
+        margin = 24
+        return pygame.Rect(
+            int(min_x) - margin,
+            int(min_y) - margin,
+            int(max_x - min_x) + margin * 2,
+            int(max_y - min_y) + margin * 2,
+        )
 
     def create_explosion(
         self,
@@ -396,15 +434,18 @@ class ParticleSystem:
         line_width = 2  # Fixed width
         lifetime = 0.2  # Longer lifetime for smoother fade
 
+        # One cos/sin pair for all segments; only the length varies
+        cos_a = math.cos(angle)
+        sin_a = math.sin(angle)
+        start_x = x
+        start_y = y
+
         for i in range(num_segments):
             # Calculate segment position with overlap
             segment_length = base_length * (1 + i * 0.8)
-            # Start exactly at bullet position
-            start_x = x
-            start_y = y
             # End behind bullet with overlap
-            end_x = x - math.cos(angle) * segment_length
-            end_y = y - math.sin(angle) * segment_length
+            end_x = x - cos_a * segment_length
+            end_y = y - sin_a * segment_length
 
             # Create line particle with decreasing initial alpha for each segment
             initial_alpha = 0.8 - (i * 0.15)  # Start more transparent
@@ -420,6 +461,41 @@ class ParticleSystem:
             )
             self.add_particle(particle)
 
+    def create_bullet_trail_batch(self, bullets):
+        """Create trail effects for every live bullet in one call.
+
+        Replaces a create_bullet_trail call per bullet per frame with a
+        single loop here: segment constants are hoisted once for the
+        whole batch and each bullet reuses its own precomputed angle
+        instead of recovering it from the velocity with atan2.
+        """
+        num_segments = 3
+        base_length = 8
+        line_width = 2
+        lifetime = 0.2
+        add = self.add_particle
+
+        for bullet in bullets:
+            x = bullet.x
+            y = bullet.y
+            color = bullet.bullet_color
+            cos_a = math.cos(bullet.angle)
+            sin_a = math.sin(bullet.angle)
+            for i in range(num_segments):
+                segment_length = base_length * (1 + i * 0.8)
+                add(
+                    LineParticle(
+                        x,
+                        y,
+                        x - cos_a * segment_length,
+                        y - sin_a * segment_length,
+                        line_width,
+                        color,
+                        lifetime,
+                        0.8 - (i * 0.15),
+                    )
+                )
+
     def create_blood_effect(
         self,
         x: float,
@@ -53,8 +53,11 @@ States:
 
 import pygame
 import math
+import logging
 from ..weapons.weapon import Weapon, WeaponType, Grenade
 
+logger = logging.getLogger(__name__)
+
 
 class Player(pygame.sprite.Sprite):
     """
@@ -163,15 +166,14 @@ class Player(pygame.sprite.Sprite):
         dy = mouse_world_y - self.rect.centery
         self.angle = math.degrees(math.atan2(dy, dx))
 
-        # Update weapon
+        # Update weapon, reusing the game's per-frame timestamp
+        now = self.game.now if self.game else pygame.time.get_ticks()
         if self.current_weapon:
-            self.current_weapon.update()
+            self.current_weapon.update(now)
 
         # Handle shooting based on weapon type and state
         if self.is_firing and self.current_weapon:
-            current_time = pygame.time.get_ticks()
-            time_since_last_shot = current_time - self.current_weapon.last_shot_time
-            if time_since_last_shot >= self.current_weapon.fire_rate:
+            if now >= self.current_weapon.next_shot_time:
                 if self.current_weapon.auto or not self.current_weapon.has_fired_once:
                     bullets = self.shoot()
                     if bullets and self.game:
@@ -185,7 +187,9 @@ class Player(pygame.sprite.Sprite):
             if event.button == 1:  # Left click
                 if self.current_weapon.is_reloading:
                     # Continue reload if in progress
-                    self.current_weapon.continue_reload()
+                    self.current_weapon.continue_reload(
+                        self.game.now if self.game else None
+                    )
                 else:
                     # Start shooting
                     self.is_firing = True
@@ -205,7 +209,9 @@ class Player(pygame.sprite.Sprite):
         elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_r:  # Reload
                 if self.current_weapon and not self.current_weapon.is_reloading:
-                    self.current_weapon.start_reload()
+                    self.current_weapon.start_reload(
+                        self.game.now if self.game else None
+                    )
             elif event.key == pygame.K_q:
                 self.cycle_weapon()
 
@@ -222,9 +228,7 @@ class Player(pygame.sprite.Sprite):
             return []
 
         current_time = pygame.time.get_ticks()
-        time_since_last_shot = current_time - self.current_weapon.last_shot_time
-
-        if time_since_last_shot >= self.current_weapon.fire_rate:
+        if current_time >= self.current_weapon.next_shot_time:
             # Handle melee weapon (knife)
             if self.current_weapon.is_melee:
                 # Get mouse position in world coordinates
@@ -253,7 +257,9 @@ class Player(pygame.sprite.Sprite):
 
                         # Add screen shake for successful hit
                         self.game.add_screen_shake(0.5)  # Less shake for melee
-                    self.current_weapon.last_shot_time = current_time
+                    self.current_weapon.next_shot_time = (
+                        current_time + self.current_weapon.fire_rate_ms
+                    )
                 return []
             else:
                 # Handle regular weapons
@@ -273,7 +279,9 @@ class Player(pygame.sprite.Sprite):
                             WeaponType.BATTLE_RIFLE: 0.9,
                         }.get(self.current_weapon.type, 0.5)
                         self.game.add_screen_shake(shake_intensity)
-                    self.current_weapon.last_shot_time = current_time
+                    self.current_weapon.next_shot_time = (
+                        current_time + self.current_weapon.fire_rate_ms
+                    )
                     return bullets
 
         return []
@@ -307,7 +315,7 @@ class Player(pygame.sprite.Sprite):
             # Update state
             self.grenades -= 1
             self.last_grenade_time = current_time
-            print(f"Threw grenade, {self.grenades} remaining")  # Debug
+            logger.debug("Threw grenade, %s remaining", self.grenades)
 
     def take_damage(self, amount):
         self.health = max(0, self.health - amount)
@@ -373,7 +381,9 @@ class Player(pygame.sprite.Sprite):
                 screen, (60, 60, 60), (bar_x, reload_y, bar_width, bar_height)
             )
             # Reload bar fill
-            reload_progress = self.current_weapon.get_reload_progress()
+            reload_progress = self.current_weapon.get_reload_progress(
+                self.game.now if self.game else None
+            )
             reload_width = int(bar_width * reload_progress)
             if reload_width > 0:
                 pygame.draw.rect(
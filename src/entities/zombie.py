@@ -36,6 +36,7 @@ This module implements the zombie enemies in the game. It provides:
 import pygame
 import math
 import random
+from collections import deque
 from enum import Enum
 
 
@@ -75,9 +76,12 @@ class Zombie(pygame.sprite.Sprite):
         self.attack_cooldown = 1000  # ms
         self.last_attack_time = 0
 
-        # Visual effects
-        self.prev_positions = [(self.x, self.y)]  # For trail effect
+        # Visual effects; deque discards the oldest point in O(1) where
+        # list.pop(0) shifted the whole list every frame
         self.max_trail_length = 5
+        self.prev_positions = deque(
+            [(self.x, self.y)], maxlen=self.max_trail_length
+        )  # For trail effect
         self.glow_radius = 20
         self.base_color = self.get_type_color()
 
@@ -118,10 +122,16 @@ class Zombie(pygame.sprite.Sprite):
         # Move horizontally towards the left side of the screen
         self.rect.x -= self.speed
 
-        # Update trail positions for glow effect
+        # Update trail positions for glow effect; the deque drops the
+        # oldest point itself once full
         self.prev_positions.append((self.rect.centerx, self.rect.centery))
-        if len(self.prev_positions) > self.max_trail_length:
-            self.prev_positions.pop(0)
+
+    def kill(self):
+        """Remove the zombie from its dense group as well as sprite groups."""
+        group = getattr(self, "_dense_group", None)
+        if group is not None:
+            group.remove(self)
+        super().kill()
 
     def take_damage(self, amount):
         """Apply damage to the zombie."""
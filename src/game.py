@@ -67,15 +67,24 @@ Performance Features:
 """
 
 import pygame
+import numpy as np
 from .entities.player import Player
 from .entities.castle import Castle
 from .managers.wave_manager import WaveManager
 from .managers.shop_manager import ShopManager
+from .structures.turrets import Turret, update_turrets
+from .weapons.grenades import update_grenades
+from .weapons.weapon import update_bullets
 from .utils.game_state import GameState
+from .utils.dense_group import DenseGroup
+from .utils.spatial_hash import SpatialHash
 import math
 import random
+import logging
 from .effects.particles import ParticleSystem
 
+logger = logging.getLogger(__name__)
+
 
 class Game:
     """
@@ -108,10 +117,18 @@ class Game:
         self.world_width = screen_width * 3
         self.world_height = screen_height * 3
 
+        # Reciprocal of the world diagonal, used to scale radar dots
+        # without a sqrt + divide per zombie
+        self._inv_max_radar_distance = 1.0 / math.hypot(
+            self.world_width, self.world_height
+        )
+
         # Game state
         self.state = GameState.SHOPPING
         self.is_paused = False
         self.cash = 500
+        # Frame timestamp, refreshed once at the top of update()
+        self.now = pygame.time.get_ticks()
 
         # Camera position
         self.camera_x = 0
@@ -124,11 +141,23 @@ class Game:
 
         # Initialize sprite groups
         self.all_sprites = pygame.sprite.Group()
-        self.bullets = pygame.sprite.Group()
-        self.zombies = pygame.sprite.Group()
+        self.bullets = DenseGroup()
+        self.zombies = DenseGroup()
         self.structures = pygame.sprite.Group()
         self.grenades = pygame.sprite.Group()
 
+        # Cached zombie center positions as parallel arrays (struct-of-arrays)
+        # so math-heavy passes (explosion radius, radar) read contiguous ints
+        # instead of chasing sprite -> rect -> attribute chains per access
+        self._zombie_count = 0
+        self._zx = np.empty(0, dtype=np.int32)
+        self._zy = np.empty(0, dtype=np.int32)
+        self._zombie_sprites = []
+
+        # Broad-phase grid over zombies, rebuilt once per frame so
+        # structures only inspect nearby cells instead of every zombie
+        self.zombie_hash = SpatialHash(cell=128)
+
         # Initialize game objects
         self.player = Player(screen_width // 4, screen_height // 2, self)
         self.castle = Castle(100, screen_height // 2)
@@ -142,6 +171,16 @@ class Game:
         # Game clock
         self.clock = pygame.time.Clock()
 
+        # Dirty-rect tracking so draw() can present only changed regions
+        # instead of flipping the full framebuffer every frame
+        self._dirty_rects = []
+        self._prev_dirty_rects = []
+        self._last_camera = None
+
+        # Pre-rendered explosion-radius rings keyed by radius, so the
+        # indicator is a single blit instead of a circle rasterize per frame
+        self._radius_ring_cache = {}
+
         # Mouse state
         self.mouse_world_x = 0
         self.mouse_world_y = 0
@@ -168,6 +207,37 @@ class Game:
             if self.screen_shake_amount < 0.1:
                 self.screen_shake_amount = 0
 
+    def refresh_zombie_positions(self):
+        """Refresh the cached zombie position arrays from the sprite group.
+
+        Returns the sprite list so callers can map array indices back to
+        zombies without a second pass over the group.
+        """
+        sprites = self.zombies.sprites()
+        n = len(sprites)
+        if self._zx.shape[0] < n:
+            self._zx = np.empty(n, dtype=np.int32)
+            self._zy = np.empty(n, dtype=np.int32)
+        for i, zombie in enumerate(sprites):
+            rect = zombie.rect
+            self._zx[i] = rect.centerx
+            self._zy[i] = rect.centery
+        self._zombie_count = n
+        self._zombie_sprites = sprites
+        return sprites
+
+    def get_radius_ring(self, radius):
+        """Get (or build) the cached ring surface for an explosion radius."""
+        radius = int(radius)
+        ring = self._radius_ring_cache.get(radius)
+        if ring is None:
+            ring = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA)
+            pygame.draw.circle(
+                ring, (255, 200, 0, 128), (radius + 1, radius + 1), radius, 1
+            )
+            self._radius_ring_cache[radius] = ring
+        return ring
+
     def screen_to_world(self, screen_x, screen_y):
         """Convert screen coordinates to world coordinates."""
         return screen_x + self.camera_x, screen_y + self.camera_y
@@ -177,12 +247,16 @@ class Game:
         return world_x - self.camera_x, world_y - self.camera_y
 
     def update(self):
+        # One timestamp for the whole frame; every entity update and
+        # draw reads this instead of its own get_ticks syscall
+        self.now = pygame.time.get_ticks()
+
         # Update mouse world coordinates
         mouse_x, mouse_y = pygame.mouse.get_pos()
         self.mouse_world_x, self.mouse_world_y = self.screen_to_world(mouse_x, mouse_y)
 
-        # Update shop manager
-        self.shop_manager.update()
+        # Update shop manager, reusing the mouse sample from above
+        self.shop_manager.update((mouse_x, mouse_y))
 
         if not self.is_paused and self.state == GameState.PLAYING:
             # Create ambient particles in the visible area
@@ -197,20 +271,34 @@ class Game:
             # Update player with world coordinates
             self.player.update(self.mouse_world_x, self.mouse_world_y)
 
-            # Update all sprites and check collisions
-            for bullet in list(self.bullets):
-                bullet.update()
-
-                # Create bullet trail particles
-                self.particle_system.create_bullet_trail(
-                    bullet.x,
-                    bullet.y,
-                    (bullet.dx, bullet.dy),
-                    color=bullet.bullet_color,  # Use bullet's own color
-                )
-
-                # Check for zombie collisions using the smaller collision rect
-                for zombie in list(self.zombies):
+            # Step every bullet in one batched NumPy pass, spawn all
+            # trail particles in one batch, then handle collisions and
+            # culling per bullet
+            live_bullets = list(self.bullets)
+            update_bullets(live_bullets)
+            # Only bullets inside the camera view (with a small margin)
+            # spawn trail particles; the rest are culled below anyway
+            view_left = self.camera_x - 50
+            view_right = self.camera_x + self.screen_width + 50
+            view_top = self.camera_y - 50
+            view_bottom = self.camera_y + self.screen_height + 50
+            self.particle_system.create_bullet_trail_batch(
+                [
+                    b
+                    for b in live_bullets
+                    if view_left <= b.x <= view_right
+                    and view_top <= b.y <= view_bottom
+                ]
+            )
+            for bullet in live_bullets:
+                # Check for zombie collisions using the smaller collision
+                # rect, scanning only the grid cells around the bullet.
+                # The grid is one frame stale (rebuilt after zombie
+                # movement), which the one-cell query padding absorbs;
+                # zombies killed earlier this frame are skipped
+                for zombie in self.zombie_hash.query_rect(bullet.collision_rect):
+                    if zombie._dense_group is None:
+                        continue
                     if bullet.collision_rect.colliderect(zombie.rect):
                         # Calculate exact impact point
                         impact_x = bullet.x
@@ -263,6 +351,23 @@ class Game:
                         amount=20,
                     )
 
+            # Refresh the cached position arrays once now that every
+            # zombie has moved; turrets and the radar read from them
+            self.refresh_zombie_positions()
+            self.zombie_hash.rebuild(self._zombie_sprites)
+
+            # Update structures; turret targeting resolves as one
+            # batched pass over the cached zombie arrays. Traps take the
+            # real frame delta so their damage is framerate-independent
+            dt_ms = self.clock.get_time()
+            turrets = []
+            for structure in self.structures:
+                if isinstance(structure, Turret):
+                    turrets.append(structure)
+                else:
+                    structure.update(self, self.now, dt_ms)
+            update_turrets(turrets, self, self.now)
+
             # Create player footstep particles when moving
             if (
                 self.player.is_moving and random.random() < 0.2
@@ -273,9 +378,10 @@ class Game:
                     color=(150, 150, 150),  # Gray for player footsteps
                 )
 
-            # Update grenades
+            # Update grenades; in-flight positions advance as one fused
+            # NumPy step over the whole group
+            update_grenades(self.grenades, self.now)
             for grenade in list(self.grenades):
-                grenade.update(pygame.time.get_ticks())
                 if grenade.exploded:
                     # Create explosion particles
                     self.particle_system.create_explosion(
@@ -287,18 +393,23 @@ class Game:
                         size_range=(2, 5),
                     )
 
-                    # Check for zombies in explosion radius
-                    for zombie in list(self.zombies):
-                        distance = math.sqrt(
-                            (zombie.rect.centerx - grenade.rect.centerx) ** 2
-                            + (zombie.rect.centery - grenade.rect.centery) ** 2
+                    # Check for zombies in explosion radius using the cached
+                    # position arrays (one vectorized distance pass)
+                    sprites = self.refresh_zombie_positions()
+                    n = self._zombie_count
+                    if n > 0:
+                        distances = np.hypot(
+                            self._zx[:n] - grenade.rect.centerx,
+                            self._zy[:n] - grenade.rect.centery,
                         )
-                        if distance <= grenade.explosion_radius:
+                        for i in np.flatnonzero(
+                            distances <= grenade.explosion_radius
+                        ):
                             damage = int(
                                 grenade.damage
-                                * (1 - distance / grenade.explosion_radius)
+                                * (1 - distances[i] / grenade.explosion_radius)
                             )
-                            zombie.take_damage(damage)
+                            sprites[i].take_damage(damage)
 
             # Update particle system
             self.particle_system.update()
@@ -309,7 +420,7 @@ class Game:
             # Check for wave completion
             if self.wave_manager.wave_complete():
                 self.state = GameState.SHOPPING
-                print("Wave complete! Entering shop...")  # Debug
+                logger.debug("Wave complete! Entering shop...")
 
             # Update camera to follow player with smoothing
             target_x = max(
@@ -357,11 +468,16 @@ class Game:
 
         # Let player handle events (shooting, weapon switching, etc.)
         if self.state == GameState.PLAYING:
-            # Update mouse world coordinates
-            mouse_x, mouse_y = pygame.mouse.get_pos()
-            self.mouse_world_x, self.mouse_world_y = self.screen_to_world(
-                mouse_x, mouse_y
-            )
+            # Only refresh mouse world coordinates for mouse events; other
+            # events reuse the value cached once per frame in update()
+            if event.type in (
+                pygame.MOUSEMOTION,
+                pygame.MOUSEBUTTONDOWN,
+                pygame.MOUSEBUTTONUP,
+            ):
+                mouse_x, mouse_y = pygame.mouse.get_pos()
+                self.mouse_world_x = mouse_x + self.camera_x
+                self.mouse_world_y = mouse_y + self.camera_y
 
             # Let player handle the event
             if self.player.handle_event(event):
@@ -370,64 +486,103 @@ class Game:
         return True
 
     def draw_game_objects(self):
-        """Draw all game objects in the correct order."""
+        """Draw all game objects in the correct order.
+
+        Returns a list of screen-space rects covering the drawn regions,
+        used for dirty-rect presentation in draw().
+        """
+        dirty = []
+
+        # Hoist the camera offset once per frame; Rect.move runs the
+        # subtraction on the C side for both blit targets and dirty rects
+        cam_x = int(self.camera_x)
+        cam_y = int(self.camera_y)
+
         # Draw world border
         border_rect = pygame.Rect(
-            -self.camera_x, -self.camera_y, self.world_width, self.world_height
+            -cam_x, -cam_y, self.world_width, self.world_height
         )
         pygame.draw.rect(self.screen, (50, 100, 50), border_rect, 3)
 
         # Draw castle first (it's the most background element)
-        self.castle.draw(
-            self.screen,
-            self.castle.rect.x - self.camera_x,
-            self.castle.rect.y - self.camera_y,
-        )
-
-        # Draw structures
+        castle_rect = self.castle.rect.move(-cam_x, -cam_y)
+        self.castle.draw(self.screen, castle_rect.x, castle_rect.y)
+        # Inflate to cover battlements and health bar above the body
+        dirty.append(castle_rect.inflate(10, 50))
+
+        # Draw structures, skipping everything outside the viewport so
+        # off-screen walls/turrets cost neither a blit nor a dirty rect
+        view_w = self.screen_width
+        view_h = self.screen_height
         for structure in self.structures:
-            structure.draw(
-                self.screen,
-                structure.rect.x - self.camera_x,
-                structure.rect.y - self.camera_y,
-            )
+            rect = structure.rect.move(-cam_x, -cam_y)
+            if rect.right < 0 or rect.left > view_w or rect.bottom < 0 or rect.top > view_h:
+                continue
+            structure.draw(self.screen, rect.x, rect.y)
+            dirty.append(rect.inflate(4, 16))
 
         # Draw zombies
         for zombie in self.zombies:
-            zombie.draw(
-                self.screen,
-                zombie.rect.x - self.camera_x,
-                zombie.rect.y - self.camera_y,
-            )
+            rect = zombie.rect.move(-cam_x, -cam_y)
+            zombie.draw(self.screen, rect.x, rect.y)
+            # Inflate to cover the glow halo and the health bar
+            dirty.append(rect.inflate(48, 48))
 
         # Draw player
-        self.player.draw(
-            self.screen,
-            self.player.rect.x - self.camera_x,
-            self.player.rect.y - self.camera_y,
-        )
+        player_rect = self.player.rect.move(-cam_x, -cam_y)
+        self.player.draw(self.screen, player_rect.x, player_rect.y)
+        # Inflate to cover the weapon, health/ammo/reload bars
+        dirty.append(player_rect.inflate(120, 120))
 
-        # Draw bullets
+        # Draw bullets as one batched blits() call
+        bullet_blits = []
         for bullet in self.bullets:
-            bullet.draw(
-                self.screen,
-                bullet.rect.x - self.camera_x,
-                bullet.rect.y - self.camera_y,
+            rect = bullet.rect.move(-cam_x, -cam_y)
+            image = bullet.image
+            bullet_blits.append(
+                (
+                    image,
+                    (
+                        rect.x - image.get_width() // 2,
+                        rect.y - image.get_height() // 2,
+                    ),
+                )
             )
+            dirty.append(rect.inflate(24, 24))
+        if bullet_blits:
+            self.screen.blits(bullet_blits)
 
         # Draw grenades
         for grenade in self.grenades:
-            grenade.draw(
-                self.screen,
-                grenade.rect.x - self.camera_x,
-                grenade.rect.y - self.camera_y,
-            )
+            rect = grenade.rect.move(-cam_x, -cam_y)
+            grenade.draw(self.screen, rect.x, rect.y, self.now)
+            radius = int(grenade.explosion_radius)
+            if not grenade.exploded:
+                # Blit the cached blast-radius ring around the grenade
+                ring = self.get_radius_ring(radius)
+                self.screen.blit(
+                    ring,
+                    (rect.centerx - radius - 1, rect.centery - radius - 1),
+                )
+            # Pad to the radius + 64 extent the molotov draw assumes:
+            # fire particles drift well outside the blast circle and
+            # blit glow sprites several times their own size
+            dirty.append(rect.inflate(radius * 2 + 128, radius * 2 + 128))
 
         # Draw particles with camera offset
-        self.particle_system.draw(self.screen, (self.camera_x, self.camera_y))
+        particle_rect = self.particle_system.draw(self.screen, (cam_x, cam_y))
+        if particle_rect is not None:
+            dirty.append(particle_rect)
+
+        return dirty
 
     def draw_ui(self):
-        """Draw all UI elements."""
+        """Draw all UI elements.
+
+        Returns a list of screen-space rects covering the drawn regions.
+        """
+        dirty = []
+
         # Draw UI background panel
         ui_panel = pygame.Surface((200, 150))
         ui_panel.fill((40, 40, 40))  # Dark gray
@@ -465,8 +620,17 @@ class Game:
                 )
             self.screen.blit(ammo_text, (15, 135))
 
+        # Panel plus the text that can overhang it
+        dirty.append(pygame.Rect(5, 5, 260, 170))
+
         # Always draw the inventory toolbar
         self.shop_manager.draw_toolbar(self.screen)
+        dirty.append(
+            pygame.Rect(0, self.screen_height - 60, self.screen_width, 60)
+        )
+        if self.shop_manager.dragging:
+            mouse_x, mouse_y = pygame.mouse.get_pos()
+            dirty.append(pygame.Rect(mouse_x - 70, mouse_y - 60, 140, 120))
 
         # Draw pause overlay if paused
         if self.is_paused:
@@ -491,9 +655,16 @@ class Game:
                 center=(self.screen_width // 2, self.screen_height // 2 + 50)
             )
             self.screen.blit(instruction_text, instruction_rect)
+            dirty.append(self.screen.get_rect())
+
+        return dirty
 
     def draw_zombie_radar(self):
-        """Draw radar indicators for off-screen zombies."""
+        """Draw radar indicators for off-screen zombies.
+
+        Returns a list of screen-space rects covering the drawn dots.
+        """
+        dirty = []
         # Constants for radar appearance
         RADAR_MARGIN = 30  # Reduced margin for more accurate positioning
         DOT_SIZE = 8
@@ -505,94 +676,139 @@ class Game:
         viewport_top = self.camera_y
         viewport_bottom = self.camera_y + self.screen_height
 
-        for zombie in self.zombies:
-            # Get zombie's screen position
-            screen_x = zombie.rect.centerx - self.camera_x
-            screen_y = zombie.rect.centery - self.camera_y
-
-            # Check if zombie is outside viewport
-            is_outside_viewport = (
-                screen_x < 0
-                or screen_x > self.screen_width
-                or screen_y < 0
-                or screen_y > self.screen_height
-            )
-
-            if is_outside_viewport:
-                # Calculate radar dot position
-                radar_x = screen_x
-                radar_y = screen_y
-
-                # Clamp to screen edges with margin
-                if radar_x < 0:
-                    radar_x = RADAR_MARGIN
-                elif radar_x > self.screen_width:
-                    radar_x = self.screen_width - RADAR_MARGIN
-
-                if radar_y < 0:
-                    radar_y = RADAR_MARGIN
-                elif radar_y > self.screen_height:
-                    radar_y = self.screen_height - RADAR_MARGIN
-
-                # Calculate distance for scaling
-                dx = zombie.rect.centerx - (self.camera_x + self.screen_width / 2)
-                dy = zombie.rect.centery - (self.camera_y + self.screen_height / 2)
-                distance = math.sqrt(dx * dx + dy * dy)
-                max_distance = math.sqrt(
-                    self.world_width * self.world_width
-                    + self.world_height * self.world_height
+        # Project cached zombie positions to screen space in one pass and
+        # only visit the off-screen ones
+        self.refresh_zombie_positions()
+        n = self._zombie_count
+        if n == 0:
+            return dirty
+        screen_xs = self._zx[:n] - self.camera_x
+        screen_ys = self._zy[:n] - self.camera_y
+        outside_viewport = np.flatnonzero(
+            (screen_xs < 0)
+            | (screen_xs > self.screen_width)
+            | (screen_ys < 0)
+            | (screen_ys > self.screen_height)
+        )
+        # Common case mid-fight: everything is on screen, nothing to draw
+        if outside_viewport.size == 0:
+            return dirty
+
+        # Hoist loop invariants and attribute lookups out of the hot loop
+        _hypot = math.hypot
+        center_x = self.camera_x + self.screen_width / 2
+        center_y = self.camera_y + self.screen_height / 2
+
+        for zi in outside_viewport:
+            screen_x = screen_xs[zi]
+            screen_y = screen_ys[zi]
+
+            # Calculate radar dot position
+            radar_x = screen_x
+            radar_y = screen_y
+
+            # Clamp to screen edges with margin
+            if radar_x < 0:
+                radar_x = RADAR_MARGIN
+            elif radar_x > self.screen_width:
+                radar_x = self.screen_width - RADAR_MARGIN
+
+            if radar_y < 0:
+                radar_y = RADAR_MARGIN
+            elif radar_y > self.screen_height:
+                radar_y = self.screen_height - RADAR_MARGIN
+
+            # Calculate distance for scaling
+            dx = self._zx[zi] - center_x
+            dy = self._zy[zi] - center_y
+            distance = _hypot(dx, dy)
+            scale = 1 - min(
+                distance * self._inv_max_radar_distance, 0.8
+            )  # Cap minimum size at 20%
+
+            # Draw radar dot with glow effect
+            base_size = DOT_SIZE * (
+                0.5 + scale * 0.5
+            )  # Scale dot size based on distance
+
+            # Draw outer glow
+            for i in range(4, 0, -1):
+                size = int(base_size) + i
+                alpha = int(255 * (1 - i / 4))
+
+                # Create a surface for this glow layer
+                glow_surf = pygame.Surface((size * 2, size * 2))
+                glow_surf.set_colorkey((0, 0, 0))
+
+                # Draw the glow circle
+                pygame.draw.circle(glow_surf, RADAR_COLOR, (size, size), size)
+
+                # Set the alpha for this layer
+                glow_surf.set_alpha(alpha)
+
+                # Blit the glow layer
+                self.screen.blit(
+                    glow_surf, (int(radar_x - size), int(radar_y - size))
                 )
-                scale = 1 - min(distance / max_distance, 0.8)  # Cap minimum size at 20%
-
-                # Draw radar dot with glow effect
-                base_size = DOT_SIZE * (
-                    0.5 + scale * 0.5
-                )  # Scale dot size based on distance
-
-                # Draw outer glow
-                for i in range(4, 0, -1):
-                    size = int(base_size) + i
-                    alpha = int(255 * (1 - i / 4))
-
-                    # Create a surface for this glow layer
-                    glow_surf = pygame.Surface((size * 2, size * 2))
-                    glow_surf.set_colorkey((0, 0, 0))
 
-                    # Draw the glow circle
-                    pygame.draw.circle(glow_surf, RADAR_COLOR, (size, size), size)
-
-                    # Set the alpha for this layer
-                    glow_surf.set_alpha(alpha)
-
-                    # Blit the glow layer
-                    self.screen.blit(
-                        glow_surf, (int(radar_x - size), int(radar_y - size))
-                    )
+            # Draw core dot (solid color)
+            pygame.draw.circle(
+                self.screen,
+                RADAR_COLOR,
+                (int(radar_x), int(radar_y)),
+                max(1, int(base_size) // 2),  # Ensure minimum size of 1
+            )
 
-                # Draw core dot (solid color)
-                pygame.draw.circle(
-                    self.screen,
-                    RADAR_COLOR,
-                    (int(radar_x), int(radar_y)),
-                    max(1, int(base_size) // 2),  # Ensure minimum size of 1
+            # Dot plus the widest glow layer
+            glow_extent = int(base_size) + 6
+            dirty.append(
+                pygame.Rect(
+                    int(radar_x) - glow_extent,
+                    int(radar_y) - glow_extent,
+                    glow_extent * 2,
+                    glow_extent * 2,
                 )
+            )
+
+        return dirty
 
     def draw(self):
         # Clear screen
         self.screen.fill((100, 150, 100))  # Light green background
 
         # Draw game objects in order (background to foreground)
-        self.draw_game_objects()
+        dirty = self.draw_game_objects()
 
         # Draw UI elements
         if self.state == GameState.SHOPPING:
             self.shop_manager.draw(self.screen)
         else:
-            self.draw_ui()
+            dirty.extend(self.draw_ui())
 
         # Draw zombie radar
-        self.draw_zombie_radar()
-
-        # Update display
-        pygame.display.flip()
+        dirty.extend(self.draw_zombie_radar())
+
+        # Present only the regions touched this frame or last frame; a
+        # camera move (or the full-screen shop/pause overlays) invalidates
+        # everything, so fall back to a full flip
+        camera = (int(self.camera_x), int(self.camera_y))
+        full_redraw = (
+            self.state == GameState.SHOPPING
+            or self.is_paused
+            or camera != self._last_camera
+        )
+        self._last_camera = camera
+
+        if full_redraw:
+            pygame.display.flip()
+            self._dirty_rects = []
+            # The flipped frame may have painted anywhere (overlays,
+            # scrolled world), so the next partial present must repaint
+            # the whole screen once or its pixels stay on the front
+            # buffer outside whatever rects that frame touches
+            self._prev_dirty_rects = [self.screen.get_rect()]
+        else:
+            self._dirty_rects = dirty
+            pygame.display.update(self._dirty_rects + self._prev_dirty_rects)
+            self._prev_dirty_rects = dirty
         self.clock.tick(60)
@@ -33,6 +33,7 @@ class ResourceManager:
     def __init__(self):
         self.sprites = {}
         self.sounds = {}
+        self._filled_variants = {}  # (name, color) -> recolored copy
         self.load_resources()
 
     def load_resources(self):
@@ -40,27 +41,45 @@ class ResourceManager:
         # For now, we'll use colored rectangles as placeholders
         # Later, you can add actual sprite images and sound files
 
-        # Create placeholder sprites
+        # Create placeholder sprites, converted to the display format so
+        # every later blit skips the per-pixel conversion inside SDL
+        # (requires the display mode to be set first)
         player_sprite = pygame.Surface((32, 32))
         player_sprite.fill((0, 255, 0))
-        self.sprites["player"] = player_sprite
+        self.sprites["player"] = player_sprite.convert()
 
         zombie_sprite = pygame.Surface((32, 32))
         zombie_sprite.fill((255, 0, 0))
-        self.sprites["zombie"] = zombie_sprite
+        self.sprites["zombie"] = zombie_sprite.convert()
 
-        bullet_sprite = pygame.Surface((8, 8))
+        bullet_sprite = pygame.Surface((8, 8), pygame.SRCALPHA)
         bullet_sprite.fill((255, 255, 0))
-        self.sprites["bullet"] = bullet_sprite
+        self.sprites["bullet"] = bullet_sprite.convert_alpha()
 
         turret_sprite = pygame.Surface((24, 24))
         turret_sprite.fill((0, 0, 255))
-        self.sprites["turret"] = turret_sprite
+        self.sprites["turret"] = turret_sprite.convert()
 
     def get_sprite(self, name):
         """Get a sprite by name. Returns None if not found."""
         return self.sprites.get(name)
 
+    def get_filled_sprite(self, name, color):
+        """
+        Get a color-filled variant of a sprite, cached per (name, color).
+        Avoids re-filling a fresh surface each time a tint is needed.
+        """
+        key = (name, color)
+        variant = self._filled_variants.get(key)
+        if variant is None:
+            base = self.sprites.get(name)
+            if base is None:
+                return None
+            variant = base.copy()
+            variant.fill(color)
+            self._filled_variants[key] = variant
+        return variant
+
     def get_sound(self, name):
         """Get a sound effect by name. Returns None if not found."""
         return self.sounds.get(name)
@@ -31,6 +31,7 @@ This class manages the in-game shop system. It provides:
 
 import pygame
 import math
+import numpy as np
 from ..structures.structure import Wall
 from ..structures.traps import SpikeTrap, SlowTrap
 from ..structures.turrets import BasicTurret, AdvancedTurret
@@ -38,6 +39,22 @@ from ..weapons.grenades import Grenade, MolotovGrenade
 from ..utils.colors import Colors
 from ..utils.game_state import GameState
 
+# Translucent drag ghosts shared across ShopItem instances, keyed by
+# item class; previews are already one surface per class, so the ghosts
+# should be too (a fresh ShopManager reuses them instead of rebuilding)
+_GHOST_CACHE = {}
+
+# Event types the shop reacts to; anything else is rejected with one
+# set-membership test instead of walking the dispatch chain
+_SHOP_EVENT_TYPES = frozenset(
+    (
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEMOTION,
+        pygame.MOUSEBUTTONUP,
+        pygame.KEYDOWN,
+    )
+)
+
 
 class ShopItem:
     """
@@ -45,6 +62,26 @@ class ShopItem:
     Contains item metadata and state.
     """
 
+    # Slots instead of a per-instance dict: these attributes are read
+    # thousands of times per frame across the draw loops
+    __slots__ = (
+        "name",
+        "cost",
+        "description",
+        "item_class",
+        "color",
+        "enabled",
+        "is_grenade",
+        "preview_image",
+        "ghost_image",
+        "name_surf",
+        "cost_enabled_surf",
+        "cost_disabled_surf",
+    )
+
+    # Shared font for name/cost labels, created on first use
+    name_font = None
+
     def __init__(self, name, cost, description, item_class, color):
         self.name = name
         self.cost = cost
@@ -52,29 +89,43 @@ class ShopItem:
         self.item_class = item_class
         self.color = color
         self.enabled = True
+        # Precomputed type flag so hot paths never call issubclass
+        self.is_grenade = issubclass(item_class, (Grenade, MolotovGrenade))
         # Create preview image
         self.preview_image = self.create_preview_image()
+        # Pre-render the name and both cost variants once; font.render is
+        # one of the slowest pygame calls and these strings never change
+        if ShopItem.name_font is None:
+            ShopItem.name_font = pygame.font.Font(None, 24)
+        self.name_surf = ShopItem.name_font.render(name, True, (50, 50, 150))
+        self.cost_enabled_surf = ShopItem.name_font.render(
+            f"${cost}", True, (34, 139, 34)
+        )
+        self.cost_disabled_surf = ShopItem.name_font.render(
+            f"${cost}", True, (200, 0, 0)
+        )
+        # Translucent drag ghost, built lazily on first drag
+        self.ghost_image = None
+
+    def get_ghost_image(self):
+        """Get the cached translucent preview used while dragging."""
+        if self.ghost_image is None and self.preview_image is not None:
+            ghost = _GHOST_CACHE.get(self.item_class)
+            if ghost is None:
+                ghost = self.preview_image.copy()
+                ghost.set_alpha(128, pygame.RLEACCEL)
+                _GHOST_CACHE[self.item_class] = ghost
+            self.ghost_image = ghost
+        return self.ghost_image
 
     def create_preview_image(self):
-        """Create a preview image of the item using its actual appearance."""
-        if issubclass(
-            self.item_class, (Wall, SpikeTrap, SlowTrap, BasicTurret, AdvancedTurret)
-        ):
-            # Create instance at 0,0 to get its appearance
-            instance = self.item_class(0, 0)
-            return instance.image
-        elif issubclass(self.item_class, (Grenade, MolotovGrenade)):
-            # Create custom preview for grenades
-            preview = pygame.Surface((32, 32), pygame.SRCALPHA)
-            if self.item_class == Grenade:
-                pygame.draw.circle(preview, (100, 100, 100), (16, 16), 8)
-            else:  # MolotovGrenade
-                # Draw bottle
-                pygame.draw.rect(preview, (200, 100, 50), (12, 12, 8, 12))
-                # Draw rag
-                pygame.draw.line(preview, (150, 150, 150), (16, 12), (16, 8), 2)
-            return preview
-        return None
+        """Get the item's preview icon, one cached surface per class.
+
+        Structure and grenade classes each expose get_preview_image(),
+        so every shop card, toolbar slot and drag ghost shares the same
+        surface instead of instantiating the item to read .image.
+        """
+        return self.item_class.get_preview_image()
 
 
 class ShopManager:
@@ -100,52 +151,194 @@ class ShopManager:
         self.drag_start_pos = None
         self.drag_offset_x = 0
         self.drag_offset_y = 0
+        # All shop fonts are built once here; draw paths never construct
+        # a Font (each construction re-parses the default font file)
         self.font = pygame.font.Font(None, 36)
+        self.number_font = pygame.font.Font(None, 20)
+
+        # Pre-rendered static text surfaces (the cash label is cached per
+        # value since it only changes when cash does)
+        self.title_surf = self.font.render("SHOP", True, (50, 50, 150))
+        self.start_wave_surf = self.font.render("Start Wave!", True, (255, 255, 255))
+        self.number_hints = [
+            self.number_font.render(str(i + 1), True, (200, 200, 200))
+            for i in range(9)
+        ]
+        self._cash_surf = None
+        self._cash_value = None
+
+        # Full-screen overlay surface, built once per screen size
+        self._overlay = None
+
+        # Static shop chrome (title, item cards, start button) composed
+        # onto one surface; rebuilt only when an enabled flag flips
+        self._chrome_surface = None
+        self._chrome_dirty = True
+
+        # Pre-baked rounded-rect chrome pieces; border_radius draws
+        # rasterize the corner arcs in software every call, so render
+        # each fixed-size style once and blit it from then on
+        self._card_surfs = {}
+        for enabled, border in ((True, (200, 210, 255)), (False, (255, 200, 200))):
+            card = pygame.Surface((100, 100), pygame.SRCALPHA)
+            pygame.draw.rect(
+                card, (255, 255, 255), card.get_rect(), border_radius=10
+            )
+            pygame.draw.rect(card, border, card.get_rect(), 2, border_radius=10)
+            self._card_surfs[enabled] = card.convert_alpha()
+        button = pygame.Surface((200, 50), pygame.SRCALPHA)
+        pygame.draw.rect(button, (100, 200, 100), button.get_rect(), border_radius=10)
+        self._button_surf = button.convert_alpha()
+
+        # Hover variant with the label baked in, so a hovered button is
+        # one blit over the chrome rather than per-frame rect/text draws
+        hover = pygame.Surface((200, 50), pygame.SRCALPHA)
+        pygame.draw.rect(hover, (120, 220, 120), hover.get_rect(), border_radius=10)
+        hover.blit(
+            self.start_wave_surf,
+            self.start_wave_surf.get_rect(center=(100, 25)),
+        )
+        self._button_hover_surf = hover.convert_alpha()
+        self._btn_hover_state = False
+
+        # Shared toolbar slot background for batched blits
+        self._slot_surf = pygame.Surface((60, 50)).convert()
+        self._slot_surf.fill((100, 100, 100))
+
+        # Cached toolbar strip (background, slots, previews, key hints),
+        # rebuilt only when the key below changes
+        self._toolbar_surface = None
+        self._toolbar_key = None
+
+        # Cached layout geometry: shop item cards, start-wave button and
+        # inventory slots, rebuilt only when screen size or inventory
+        # length changes instead of per frame / per event
+        self._layout_size = None
+        self._shop_item_rects = []
+        self._start_wave_button_rect = None
+        self._toolbar_y = 0
+        self._cash_pos = (0, 0)
+        self._inventory_len = -1
+        self._inventory_rects = []
+
+        # Parallel arrays over shop_items (struct-of-arrays) so the
+        # affordability pass runs as one vectorized comparison
+        self._costs = np.array([item.cost for item in self.shop_items], dtype=np.int32)
+        self._enabled = np.ones(len(self.shop_items), dtype=bool)
+
+        # Mouse position sampled once per update() tick; draw paths reuse
+        # it instead of asking SDL again
+        self._frame_mouse = (0, 0)
+
+        # Cash value the enabled flags were last computed against
+        self._last_cash = None
+
+        # Inventory indices of grenade items, maintained incrementally on
+        # every append/remove so cycle_grenades never rescans the inventory
+        self._grenade_inv_positions = []
+
+        # Spatial hash of structure rects for placement collision checks;
+        # cell size is ~2x a typical structure so rects span few buckets
+        self._structure_hash = {}
+        self._structure_hash_count = -1
+        self._structure_cell = 128
+
+    def _ensure_layout(self, screen_w, screen_h):
+        """(Re)build the cached shop and inventory rects when needed."""
+        if self._layout_size != (screen_w, screen_h):
+            self._layout_size = (screen_w, screen_h)
+            item_spacing = 120
+            start_x = (screen_w - (len(self.shop_items) * item_spacing)) // 2
+            self._shop_item_rects = [
+                pygame.Rect(start_x + (i * item_spacing), 100, 100, 100)
+                for i in range(len(self.shop_items))
+            ]
+            self._start_wave_button_rect = pygame.Rect(
+                (screen_w - 200) // 2, screen_h - 150, 200, 50
+            )
+            self._toolbar_y = screen_h - 60
+            self._cash_pos = (screen_w - 150, 20)
+            self._inventory_len = -1  # force slot rebuild below
+        if self._inventory_len != len(self.inventory):
+            self._inventory_len = len(self.inventory)
+            self._inventory_rects = [
+                pygame.Rect(10 + i * 70, self._toolbar_y + 5, 60, 50)
+                for i in range(self._inventory_len)
+            ]
+
+    def _inventory_append(self, item):
+        """Add an item to the inventory, keeping the grenade index list in sync."""
+        if item.is_grenade:
+            self._grenade_inv_positions.append(len(self.inventory))
+        self.inventory.append(item)
+
+    def _inventory_remove(self, item):
+        """Remove an item from the inventory, shifting cached grenade indices."""
+        index = self.inventory.index(item)
+        del self.inventory[index]
+        self._grenade_inv_positions = [
+            pos - 1 if pos > index else pos
+            for pos in self._grenade_inv_positions
+            if pos != index
+        ]
+
+    def cycle_grenades(self):
+        """Select the next grenade in the inventory (G key).
+
+        Works off the incrementally maintained index list, so cycling is
+        a lookup over the handful of grenades rather than a full
+        inventory rescan with issubclass checks.
+        """
+        positions = self._grenade_inv_positions
+        if not positions:
+            return
+        next_i = 0
+        if self.selected_item is not None and self.selected_item.is_grenade:
+            current = self.inventory.index(self.selected_item)
+            if current in positions:
+                next_i = (positions.index(current) + 1) % len(positions)
+        self.selected_item = self.inventory[positions[next_i]]
+        self.placing_item = True
 
     def handle_event(self, event):
         """Handle mouse and keyboard events for shop interaction."""
+        if event.type not in _SHOP_EVENT_TYPES:
+            return False
+
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
                 mouse_x, mouse_y = event.pos
+                self._ensure_layout(self.game.screen_width, self.game.screen_height)
 
                 # Handle start wave button
                 if self.game.state == GameState.SHOPPING:
-                    button_width = 200
-                    button_height = 50
-                    button_x = (self.game.screen_width - button_width) // 2
-                    button_y = self.game.screen_height - 150  # Above toolbar
-                    button_rect = pygame.Rect(
-                        button_x, button_y, button_width, button_height
-                    )
-
-                    if button_rect.collidepoint(mouse_x, mouse_y):
+                    if self._start_wave_button_rect.collidepoint(mouse_x, mouse_y):
                         self.game.state = GameState.PLAYING
                         self.game.wave_manager.start_next_wave()
                         return True
 
                     # Handle shop items purchase
-                    item_spacing = 120
-                    start_x = (
-                        self.game.screen_width - (len(self.shop_items) * item_spacing)
-                    ) // 2
-                    start_y = 100
-
-                    for i, item in enumerate(self.shop_items):
-                        item_rect = pygame.Rect(
-                            start_x + (i * item_spacing), start_y, 100, 100
-                        )
+                    for item, item_rect in zip(
+                        self.shop_items, self._shop_item_rects
+                    ):
                         if item_rect.collidepoint(mouse_x, mouse_y):
                             if item.enabled and self.game.cash >= item.cost:
                                 self.game.cash -= item.cost
-                                self.inventory.append(item)
+                                self._inventory_append(item)
                                 return True
 
-                # Check inventory items
-                toolbar_y = self.game.screen_height - 60
-                for i, item in enumerate(self.inventory):
-                    item_rect = pygame.Rect(10 + i * 70, toolbar_y + 5, 60, 50)
-                    if item_rect.collidepoint(mouse_x, mouse_y):
-                        self.selected_item = item
+                # Check inventory items; slots sit on a uniform grid, so
+                # the clicked index is direct arithmetic rather than a
+                # collidepoint scan over every slot
+                if (
+                    self._toolbar_y + 5 <= mouse_y < self._toolbar_y + 55
+                    and mouse_x >= 10
+                    and (mouse_x - 10) % 70 < 60
+                ):
+                    i = (mouse_x - 10) // 70
+                    if i < len(self.inventory):
+                        item_rect = self._inventory_rects[i]
+                        self.selected_item = self.inventory[i]
                         self.placing_item = True
                         self.dragging = True
                         self.drag_start_pos = (mouse_x, mouse_y)
@@ -153,6 +346,17 @@ class ShopManager:
                         self.drag_offset_y = mouse_y - item_rect.y
                         return True
 
+                # Keyboard-selected item: place it on click. Handling
+                # this here (instead of polling the mouse every update
+                # tick) makes placement an O(1) event-driven path
+                if self.placing_item and self.selected_item and not self.dragging:
+                    if self.is_valid_placement_location(mouse_x, mouse_y):
+                        if self._place_selected(mouse_x, mouse_y):
+                            self.selected_item = None
+                            self.placing_item = False
+                        # Structures keep the selection for repeat placement
+                    return True
+
             elif event.button == 3:  # Right click
                 self.selected_item = None
                 self.placing_item = False
@@ -166,38 +370,11 @@ class ShopManager:
         elif event.type == pygame.MOUSEBUTTONUP:
             if event.button == 1 and self.dragging:
                 mouse_x, mouse_y = event.pos
-                # Check if the item was dropped in a valid location
-                if self.is_valid_placement_location(mouse_x, mouse_y):
-                    # Convert screen coordinates to world coordinates
-                    world_x = mouse_x + self.game.camera.x
-                    world_y = mouse_y + self.game.camera.y
-
-                    # Create and place the item
-                    if self.selected_item.item_class:
-                        if issubclass(
-                            self.selected_item.item_class, (Grenade, MolotovGrenade)
-                        ):
-                            # For throwables, add to game's projectiles
-                            angle = math.atan2(
-                                world_y - self.game.player.y,
-                                world_x - self.game.player.x,
-                            )
-                            projectile = self.selected_item.item_class(
-                                self.game.player.x, self.game.player.y, angle, self.game
-                            )
-                            self.game.projectiles.add(projectile)
-                        else:
-                            # For structures, create and add to game's structures
-                            structure = self.selected_item.item_class(
-                                world_x, world_y, self.game
-                            )
-                            self.game.structures.add(structure)
-
-                        # Remove item if it's a one-time use item
-                        if issubclass(
-                            self.selected_item.item_class, (Grenade, MolotovGrenade)
-                        ):
-                            self.inventory.remove(self.selected_item)
+                # Place the item if it was dropped in a valid location
+                if self.selected_item and self.is_valid_placement_location(
+                    mouse_x, mouse_y
+                ):
+                    self._place_selected(mouse_x, mouse_y)
 
                 self.selected_item = None
                 self.placing_item = False
@@ -205,8 +382,8 @@ class ShopManager:
                 return True
 
         elif event.type == pygame.KEYDOWN:
-            if event.key in range(pygame.K_1, pygame.K_9 + 1):
-                index = event.key - pygame.K_1
+            index = event.key - pygame.K_1
+            if 0 <= index <= 8:
                 if index < len(self.inventory):
                     self.selected_item = self.inventory[index]
                     self.placing_item = True
@@ -224,6 +401,57 @@ class ShopManager:
 
         return False
 
+    def _place_selected(self, screen_x, screen_y):
+        """Place the selected item at an already-validated screen position.
+
+        Single placement path shared by click-to-place and drag-drop.
+        Returns True when the selection was consumed (throwables are
+        single-use); structures leave it selected for repeat placement.
+        """
+        world_x = screen_x + self.game.camera_x
+        world_y = screen_y + self.game.camera_y
+
+        if self.selected_item.is_grenade:
+            # Throw towards the target from the player; normalizing the
+            # vector directly skips the atan2 plus cos/sin round-trip
+            dx = world_x - self.game.player.x
+            dy = world_y - self.game.player.y
+            dist = math.hypot(dx, dy)
+            inv = 1.0 / dist if dist else 0.0
+            projectile = self.selected_item.item_class(
+                self.game.player.x, self.game.player.y, dx * inv, dy * inv
+            )
+            # Arm a fuse so placed grenades detonate like thrown ones
+            # (the batched grenade update checks explode_at) instead of
+            # drifting in the group forever
+            projectile.explode_at = self.game.now + 2000
+            self.game.grenades.add(projectile)
+            self._inventory_remove(self.selected_item)
+            return True
+
+        structure = self.selected_item.item_class(world_x, world_y)
+        self.game.structures.add(structure)
+        return False
+
+    def _get_structure_hash(self):
+        """Spatial hash of structure rects, rebuilt when the count changes.
+
+        Rect objects are shared with the sprites, so only additions and
+        removals invalidate the hash (placed structures never move).
+        """
+        structures = self.game.structures.sprites()
+        if len(structures) != self._structure_hash_count:
+            cell = self._structure_cell
+            grid = {}
+            for structure in structures:
+                rect = structure.rect
+                for cx in range(rect.left // cell, rect.right // cell + 1):
+                    for cy in range(rect.top // cell, rect.bottom // cell + 1):
+                        grid.setdefault((cx, cy), []).append(rect)
+            self._structure_hash = grid
+            self._structure_hash_count = len(structures)
+        return self._structure_hash
+
     def is_valid_placement_location(self, x, y):
         """Check if the current position is valid for item placement."""
         # Don't allow placement in the toolbar area
@@ -234,46 +462,84 @@ class ShopManager:
         if self.game.state == GameState.SHOPPING and y < 250:
             return False
 
+        # Structures may not overlap an existing structure; collidelist
+        # runs the whole scan in C and early-exits on the first hit
+        if (
+            self.selected_item is not None
+            and self.selected_item.item_class
+            and not self.selected_item.is_grenade
+        ):
+            temp_rect = pygame.Rect(
+                x + self.game.camera_x, y + self.game.camera_y, 40, 40
+            )
+            grid = self._get_structure_hash()
+            if grid:
+                cell = self._structure_cell
+                candidates = []
+                for cx in range(temp_rect.left // cell, temp_rect.right // cell + 1):
+                    for cy in range(
+                        temp_rect.top // cell, temp_rect.bottom // cell + 1
+                    ):
+                        candidates.extend(grid.get((cx, cy), ()))
+                if candidates and temp_rect.collidelist(candidates) != -1:
+                    return False
+
         return True
 
     def draw_toolbar(self, screen):
         """Draw the inventory toolbar at the bottom of the screen."""
-        # Draw toolbar background
-        toolbar_height = 60
-        toolbar_y = self.game.screen_height - toolbar_height
-        pygame.draw.rect(
-            screen, (50, 50, 50), (0, toolbar_y, self.game.screen_width, toolbar_height)
+        self._ensure_layout(self.game.screen_width, self.game.screen_height)
+
+        # The static strip only changes when the inventory contents, the
+        # dragged selection or the screen width change; rebuild it then
+        # and otherwise reuse one cached surface per frame
+        key = (
+            tuple(id(item) for item in self.inventory),
+            id(self.selected_item) if self.dragging else None,
+            self.game.screen_width,
         )
-
-        # Draw inventory items
-        for i, item in enumerate(self.inventory):
-            item_rect = pygame.Rect(10 + i * 70, toolbar_y + 5, 60, 50)
-
-            # Don't draw the item in the toolbar if it's being dragged
-            if item != self.selected_item or not self.dragging:
-                pygame.draw.rect(screen, (100, 100, 100), item_rect)
-                if hasattr(item, "preview_image") and item.preview_image:
-                    screen.blit(item.preview_image, item_rect)
-
-                # Draw number key hint
-                number_font = pygame.font.Font(None, 20)
-                number_text = number_font.render(str(i + 1), True, (200, 200, 200))
-                screen.blit(number_text, (item_rect.x + 2, item_rect.y + 2))
+        if self._toolbar_surface is None or key != self._toolbar_key:
+            self._toolbar_key = key
+            strip = pygame.Surface((self.game.screen_width, 60)).convert()
+            strip.fill((50, 50, 50))
+
+            # Slot background, preview and number-key hint per slot,
+            # batched into one blits() call in strip-local coordinates
+            blit_seq = []
+            for i, item in enumerate(self.inventory):
+                item_rect = self._inventory_rects[i]
+                local_x = item_rect.x
+                local_y = item_rect.y - self._toolbar_y
+
+                # Don't draw the item in the toolbar if it's being dragged
+                if item != self.selected_item or not self.dragging:
+                    blit_seq.append((self._slot_surf, (local_x, local_y)))
+                    if item.preview_image:
+                        blit_seq.append((item.preview_image, (local_x, local_y)))
+
+                    # Number key hint
+                    if i < len(self.number_hints):
+                        blit_seq.append(
+                            (self.number_hints[i], (local_x + 2, local_y + 2))
+                        )
+            if blit_seq:
+                strip.blits(blit_seq)
+            self._toolbar_surface = strip
+        screen.blit(self._toolbar_surface, (0, self._toolbar_y))
 
         # Draw dragged item
         if self.dragging and self.selected_item:
-            mouse_x, mouse_y = pygame.mouse.get_pos()
+            mouse_x, mouse_y = self._frame_mouse
             drag_rect = pygame.Rect(
                 mouse_x - self.drag_offset_x, mouse_y - self.drag_offset_y, 60, 50
             )
 
-            # Draw item preview
+            # Draw item preview as the cached translucent ghost; no
+            # copy()/set_alpha() allocation on the per-frame path
             pygame.draw.rect(screen, (100, 100, 100), drag_rect)
-            if (
-                hasattr(self.selected_item, "preview_image")
-                and self.selected_item.preview_image
-            ):
-                screen.blit(self.selected_item.preview_image, drag_rect)
+            ghost = self.selected_item.get_ghost_image()
+            if ghost is not None:
+                screen.blit(ghost, drag_rect)
 
             # Draw placement indicator
             if self.is_valid_placement_location(mouse_x, mouse_y):
@@ -288,124 +554,109 @@ class ShopManager:
         else:
             self.draw_toolbar(screen)
 
-    def draw_shop_overlay(self, screen):
-        """Draw the shop interface overlay."""
-        # Draw semi-transparent overlay
-        overlay = pygame.Surface((screen.get_width(), screen.get_height()))
-        overlay.fill((230, 240, 255))
-        overlay.set_alpha(200)
-        screen.blit(overlay, (0, 0))
-
-        # Draw shop title
-        title = self.font.render("SHOP", True, (50, 50, 150))
-        title_rect = title.get_rect(centerx=screen.get_width() // 2, y=20)
-        screen.blit(title, title_rect)
-
-        # Draw available cash
-        cash_text = self.font.render(f"Cash: ${self.game.cash}", True, (34, 139, 34))
-        screen.blit(cash_text, (screen.get_width() - 150, 20))
-
-        # Draw items grid
-        item_spacing = 120
-        start_x = (screen.get_width() - (len(self.shop_items) * item_spacing)) // 2
+    def _rebuild_chrome(self, screen):
+        """Compose the static shop chrome onto one cached surface.
+
+        Covers the title, every item card (frame, border, preview, name,
+        cost) and the start-wave button — everything that only changes
+        when an item's enabled flag flips or the screen size changes.
+        """
+        size = screen.get_size()
+
+        # Semi-transparent backdrop, built once per screen size
+        if self._overlay is None or self._overlay.get_size() != size:
+            self._overlay = pygame.Surface(size).convert()
+            self._overlay.fill((230, 240, 255))
+            self._overlay.set_alpha(200, pygame.RLEACCEL)
+
+        chrome = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+
+        # Shop title
+        title_rect = self.title_surf.get_rect(centerx=size[0] // 2, y=20)
+        chrome.blit(self.title_surf, title_rect)
+
+        # Items grid
+        self._ensure_layout(size[0], size[1])
         start_y = 100
 
-        for i, item in enumerate(self.shop_items):
-            x = start_x + (i * item_spacing)
-            item_rect = pygame.Rect(x, start_y, 100, 100)
+        for item, item_rect in zip(self.shop_items, self._shop_item_rects):
+            x = item_rect.x
 
-            # Draw item card
-            pygame.draw.rect(screen, (255, 255, 255), item_rect, border_radius=10)
-            if item.enabled:
-                color = (200, 210, 255)
-            else:
-                color = (255, 200, 200)
-            pygame.draw.rect(screen, color, item_rect, 2, border_radius=10)
+            # Draw item card from the pre-baked rounded-rect surface
+            chrome.blit(self._card_surfs[item.enabled], item_rect)
 
             # Draw item preview
-            if hasattr(item, "preview_image") and item.preview_image:
+            if item.preview_image:
                 preview_rect = item.preview_image.get_rect(
                     center=(x + 50, start_y + 40)
                 )
-                screen.blit(item.preview_image, preview_rect)
+                chrome.blit(item.preview_image, preview_rect)
 
-            # Draw item name and cost
-            name_font = pygame.font.Font(None, 24)
-            name_text = name_font.render(item.name, True, (50, 50, 150))
-            cost_text = name_font.render(
-                f"${item.cost}", True, (34, 139, 34) if item.enabled else (200, 0, 0)
+            # Draw item name and cost from the pre-rendered surfaces
+            cost_surf = (
+                item.cost_enabled_surf if item.enabled else item.cost_disabled_surf
             )
-            screen.blit(name_text, (x + 10, start_y + 75))
-            screen.blit(cost_text, (x + 10, start_y + 90))
+            chrome.blit(item.name_surf, (x + 10, start_y + 75))
+            chrome.blit(cost_surf, (x + 10, start_y + 90))
 
         # Draw start wave button
-        button_width = 200
-        button_height = 50
-        button_x = (screen.get_width() - button_width) // 2
-        button_y = screen.get_height() - 150
-
-        pygame.draw.rect(
-            screen,
-            (100, 200, 100),
-            (button_x, button_y, button_width, button_height),
-            border_radius=10,
-        )
+        button_rect = self._start_wave_button_rect
+        chrome.blit(self._button_surf, button_rect)
+
+        text_rect = self.start_wave_surf.get_rect(center=button_rect.center)
+        chrome.blit(self.start_wave_surf, text_rect)
+
+        self._chrome_surface = chrome
+        self._chrome_dirty = False
+
+    def draw_shop_overlay(self, screen):
+        """Draw the shop interface overlay."""
+        if (
+            self._chrome_dirty
+            or self._chrome_surface is None
+            or self._chrome_surface.get_size() != screen.get_size()
+        ):
+            self._rebuild_chrome(screen)
 
-        text = self.font.render("Start Wave!", True, (255, 255, 255))
-        text_rect = text.get_rect(
-            center=(button_x + button_width // 2, button_y + button_height // 2)
+        # Static chrome: backdrop plus all the cards in two blits
+        screen.blit(self._overlay, (0, 0))
+        screen.blit(self._chrome_surface, (0, 0))
+
+        # Hover highlight over the baked start-wave button; the normal
+        # state is already part of the chrome and costs nothing here
+        self._btn_hover_state = self._start_wave_button_rect.collidepoint(
+            self._frame_mouse
         )
-        screen.blit(text, text_rect)
+        if self._btn_hover_state:
+            screen.blit(self._button_hover_surf, self._start_wave_button_rect)
+
+        # Draw available cash (re-render only when the value changes)
+        if self._cash_value != self.game.cash:
+            self._cash_value = self.game.cash
+            self._cash_surf = self.font.render(
+                f"Cash: ${self.game.cash}", True, (34, 139, 34)
+            )
+        screen.blit(self._cash_surf, self._cash_pos)
 
         # Draw toolbar
         self.draw_toolbar(screen)
 
-    def update(self):
-        """Update shop state and handle item placement/dragging."""
-        # Update enabled states based on cash
-        for item in self.shop_items:
-            item.enabled = self.game.cash >= item.cost
-
-        # Handle item placement/dragging
-        if self.placing_item and self.selected_item:
-            mouse_pos = pygame.mouse.get_pos()
-
-            # Convert screen to world coordinates
-            world_x = mouse_pos[0] + self.game.camera.x
-            world_y = mouse_pos[1] + self.game.camera.y
-
-            # Update placement preview
-            if not self.dragging and pygame.mouse.get_pressed()[0]:
-                if self.is_valid_placement_location(mouse_pos[0], mouse_pos[1]):
-                    if self.selected_item.item_class:
-                        if issubclass(
-                            self.selected_item.item_class, (Grenade, MolotovGrenade)
-                        ):
-                            # For throwables, add to game's projectiles
-                            angle = math.atan2(
-                                world_y - self.game.player.y,
-                                world_x - self.game.player.x,
-                            )
-                            projectile = self.selected_item.item_class(
-                                self.game.player.x, self.game.player.y, angle, self.game
-                            )
-                            self.game.projectiles.add(projectile)
-
-                            # Remove throwable from inventory
-                            self.inventory.remove(self.selected_item)
-                            self.selected_item = None
-                            self.placing_item = False
-                        else:
-                            # For structures, create and add to game's structures
-                            structure = self.selected_item.item_class(
-                                world_x, world_y, self.game
-                            )
-                            self.game.structures.add(structure)
-
-                            # Keep selected for multiple placements
-                            if issubclass(
-                                self.selected_item.item_class, (Grenade, MolotovGrenade)
-                            ):
-                                self.inventory.remove(self.selected_item)
-                                self.selected_item = None
-                                self.placing_item = False
+    def update(self, mouse_pos=None):
+        """Update shop state and handle item placement/dragging.
+
+        The game passes its once-per-tick mouse sample in; the SDL query
+        only runs here as a fallback when called standalone.
+        """
+        self._frame_mouse = (
+            mouse_pos if mouse_pos is not None else pygame.mouse.get_pos()
+        )
+        # Update enabled states based on cash; skipped entirely while cash
+        # is unchanged, and any flip invalidates the pre-composed chrome
+        if self.game.cash != self._last_cash:
+            self._last_cash = self.game.cash
+            new_enabled = self._costs <= self.game.cash
+            if not np.array_equal(new_enabled, self._enabled):
+                self._enabled = new_enabled
+                self._chrome_dirty = True
+                for item, enabled in zip(self.shop_items, new_enabled):
+                    item.enabled = bool(enabled)
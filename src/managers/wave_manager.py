@@ -29,9 +29,14 @@ This class manages the zombie wave spawning system. It provides:
    - Controls wave pacing
 """
 
+import logging
+import numpy as np
 import pygame
 import random
 from ..entities.zombie import Zombie, ZombieType
+from ..utils.game_state import GameState
+
+logger = logging.getLogger(__name__)
 
 
 class WaveManager:
@@ -40,9 +45,14 @@ class WaveManager:
         self.current_wave = 0
         self.zombies_to_spawn = 0
         self.spawn_delay = 2000  # ms between spawns
-        self.last_spawn_time = 0
         self.wave_complete_flag = False
 
+        # Per-wave spawn schedule: rows and due times are generated in
+        # one batched RNG call instead of per-spawn randint/ticks polls
+        self._spawn_times = None
+        self._spawn_ys = None
+        self._next_spawn_idx = 0
+
         # Wave configuration and scaling
         self.base_zombies = 5  # Starting number of zombies
         self.zombies_per_wave = 2  # Additional zombies per wave
@@ -58,19 +68,41 @@ class WaveManager:
         self.zombies_to_spawn = (
             self.base_zombies + (self.current_wave - 1) * self.zombies_per_wave
         )
-        print(
-            f"Starting wave {self.current_wave} with {self.zombies_to_spawn} zombies"
-        )  # Debug
+        logger.debug(
+            "Starting wave %d with %d zombies", self.current_wave, self.zombies_to_spawn
+        )
         self.wave_complete_flag = False
-        self.last_spawn_time = 0  # Reset spawn timer
+
+        # Pre-schedule the whole wave's spawn times; rows are filled in
+        # on the first update, once the world size is available
+        self._spawn_times = pygame.time.get_ticks() + np.arange(
+            self.zombies_to_spawn, dtype=np.int64
+        ) * self.spawn_delay
+        self._spawn_ys = None
+        self._spawn_types = self.build_type_sequence(self.zombies_to_spawn)
+        self._next_spawn_idx = 0
+
+    def build_type_sequence(self, count):
+        """
+        Pick every zombie type for the wave up front.
+        One weighted random.choices call replaces a random.random plus
+        random.choice pair per spawn; boss waves are all TANK.
+        """
+        if self.current_wave in self.boss_waves:
+            return [ZombieType.TANK] * count
+
+        p = self.special_zombie_chance
+        return random.choices(
+            [ZombieType.NORMAL, ZombieType.FAST, ZombieType.TANK],
+            weights=[1 - p, p / 2, p / 2],
+            k=count,
+        )
 
     def update(self, game):
         """
         Update wave state and handle zombie spawning.
         Checks wave completion and manages spawn timing.
         """
-        from ..game import GameState
-
         if game.state != GameState.PLAYING or game.is_paused:
             return
 
@@ -80,43 +112,39 @@ class WaveManager:
                 self.wave_complete_flag = True
             return
 
+        # One batched RNG call covers every spawn row for the wave
+        if self._spawn_ys is None:
+            self._spawn_ys = np.random.randint(
+                50, game.world_height - 50, size=self.zombies_to_spawn, dtype=np.int32
+            )
+
+        # Spawn everything whose scheduled time has elapsed in one pass,
+        # so late waves are not throttled to one zombie per frame
         current_time = pygame.time.get_ticks()
-        if current_time - self.last_spawn_time > self.spawn_delay:
+        due = int(np.searchsorted(self._spawn_times, current_time, side="right"))
+        while self._next_spawn_idx < due and self.zombies_to_spawn > 0:
             self.spawn_zombie(game)
-            self.last_spawn_time = current_time
 
     def spawn_zombie(self, game):
         """
-        Spawn a new zombie in the game world.
-        Determines position and type based on wave settings.
+        Spawn the next scheduled zombie in the game world.
+        Position comes from the wave's precomputed spawn rows.
         """
         # Spawn from right side of world with some margin
         x = game.world_width - 50  # Changed to spawn closer to the visible area
-        y = random.randint(50, game.world_height - 50)
-
-        # Determine zombie type
-        zombie_type = self.determine_zombie_type()
+        y = int(self._spawn_ys[self._next_spawn_idx])
+        zombie_type = self._spawn_types[self._next_spawn_idx]
+        self._next_spawn_idx += 1
 
         # Create and add zombie
         zombie = Zombie(x, y, zombie_type)
         game.zombies.add(zombie)
-        print(f"Spawned {zombie_type} zombie at ({x}, {y})")  # Debug
+        # Lazy %-formatting: the string is only built if debug logging
+        # is actually enabled, so tight spawn bursts pay nothing
+        logger.debug("Spawned %s zombie at (%d, %d)", zombie_type, x, y)
 
         self.zombies_to_spawn -= 1
 
-    def determine_zombie_type(self):
-        """
-        Determine the type of zombie to spawn.
-        Considers boss waves and special zombie chances.
-        """
-        if self.current_wave in self.boss_waves:
-            return ZombieType.TANK  # Changed BOSS to TANK since BOSS wasn't defined
-
-        if random.random() < self.special_zombie_chance:
-            return random.choice([ZombieType.FAST, ZombieType.TANK])
-
-        return ZombieType.NORMAL
-
     def wave_complete(self):
         """Check if current wave is complete."""
         return self.wave_complete_flag and self.zombies_to_spawn <= 0
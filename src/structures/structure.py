@@ -17,18 +17,49 @@ import math
 class Structure(pygame.sprite.Sprite):
     def __init__(self, x, y, width, height, health):
         super().__init__()
-        self.image = pygame.Surface((width, height))
+        # Match the display format up front so every blit of this image
+        # skips SDL's per-pixel conversion
+        self.image = pygame.Surface((width, height)).convert()
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
         self.health = health
         self.max_health = health
+        # Health-bar strip, baked on damage; stays None while undamaged
+        self._bar_surface = None
+
+    # Per-class cached shop/toolbar icon (see get_preview_image)
+    _preview_image = None
+
+    @classmethod
+    def get_preview_image(cls):
+        """Shared preview icon for this structure class.
+
+        Built once per class from a throwaway (0, 0) instance and cached,
+        so the shop never re-runs structure init/draw code just to show
+        an icon. Assumes the concrete class takes an (x, y) constructor.
+        """
+        if cls.__dict__.get("_preview_image") is None:
+            cls._preview_image = cls(0, 0).image.convert()
+        return cls.__dict__["_preview_image"]
 
     def take_damage(self, amount):
         """Apply damage to the structure and destroy if health reaches 0."""
         self.health -= amount
         if self.health <= 0:
             self.kill()
+        else:
+            self._rebuild_bar()
+
+    def _rebuild_bar(self):
+        """Re-bake the health strip; only runs when health changes."""
+        bar_width = self.rect.width
+        if self._bar_surface is None:
+            self._bar_surface = pygame.Surface((bar_width, 3)).convert()
+        self._bar_surface.fill((255, 0, 0))
+        fill_width = bar_width * self.health // self.max_health
+        if fill_width > 0:
+            self._bar_surface.fill((0, 255, 0), (0, 0, fill_width, 3))
 
     def draw(self, screen, x, y):
         """
@@ -38,16 +69,11 @@ class Structure(pygame.sprite.Sprite):
             screen: Target surface to draw on
             x, y: Screen coordinates to draw at
         """
-        # Draw structure
+        # Draw structure plus the pre-baked health strip (if damaged);
+        # two blits per structure, no per-frame rect rasterization
         screen.blit(self.image, (x, y))
-
-        # Draw health bar
-        pygame.draw.rect(screen, (255, 0, 0), (x, y - 5, self.rect.width, 3))
-        pygame.draw.rect(
-            screen,
-            (0, 255, 0),
-            (x, y - 5, self.rect.width * (self.health / self.max_health), 3),
-        )
+        if self._bar_surface is not None:
+            screen.blit(self._bar_surface, (x, y - 5))
 
 
 class Wall(Structure):
@@ -95,22 +121,26 @@ class Turret(Structure):
         self.damage = damage
         self.fire_rate = fire_rate
         self.range = range
+        self.range_sq = range * range
         self.target = None
         self.last_shot_time = 0
         self.angle = 0
 
     def update(self, zombies, bullets, current_time):
-        # Find nearest zombie in range
-        nearest_dist = float("inf")
+        # Find nearest zombie in range on squared distances; ordering is
+        # preserved without the sqrt inside math.hypot, and seeding the
+        # best-so-far with range_sq folds both checks into one compare
+        nearest_d2 = self.range_sq
         self.target = None
+        cx = self.rect.centerx
+        cy = self.rect.centery
 
         for zombie in zombies:
-            dist = math.hypot(
-                zombie.rect.centerx - self.rect.centerx,
-                zombie.rect.centery - self.rect.centery,
-            )
-            if dist <= self.range and dist < nearest_dist:
-                nearest_dist = dist
+            dx = zombie.rect.centerx - cx
+            dy = zombie.rect.centery - cy
+            d2 = dx * dx + dy * dy
+            if d2 <= nearest_d2:
+                nearest_d2 = d2
                 self.target = zombie
 
         # Update angle and shoot if we have a target
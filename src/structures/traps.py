@@ -11,6 +11,10 @@ from ..ui.ui_helper import Colors
 
 
 class SpikeTrap(Structure):
+    # Visual-state sprites shared by every instance, rasterized once
+    _IMG_ACTIVE = None
+    _IMG_COOLDOWN = None
+
     def __init__(self, x, y):
         super().__init__(x, y, 40, 40, 100)  # 40x40 size, 100 health
         self.damage = 20  # Damage per second
@@ -20,59 +24,71 @@ class SpikeTrap(Structure):
         self.draw_trap()
 
     def draw_trap(self):
-        """Draw the spike trap appearance."""
-        # Draw base
-        pygame.draw.rect(
-            self.image, Colors.PANEL_BG, (0, 0, self.rect.width, self.rect.height)
-        )
-
-        # Draw spikes
-        spike_color = (200, 50, 50)
-        for i in range(4):
-            for j in range(4):
-                x = i * 10 + 5
-                y = j * 10 + 5
-                points = [(x, y + 7), (x + 3, y), (x + 7, y + 7)]
-                pygame.draw.polygon(self.image, spike_color, points)
-
-    def update(self, game):
+        """Show the active-state sprite (rasterized once per class)."""
+        if SpikeTrap._IMG_ACTIVE is None:
+            img = pygame.Surface((self.rect.width, self.rect.height)).convert()
+            # Draw base
+            pygame.draw.rect(
+                img, Colors.PANEL_BG, (0, 0, self.rect.width, self.rect.height)
+            )
+
+            # Draw spikes
+            spike_color = (200, 50, 50)
+            for i in range(4):
+                for j in range(4):
+                    x = i * 10 + 5
+                    y = j * 10 + 5
+                    points = [(x, y + 7), (x + 3, y), (x + 7, y + 7)]
+                    pygame.draw.polygon(img, spike_color, points)
+            SpikeTrap._IMG_ACTIVE = img
+        self.image = SpikeTrap._IMG_ACTIVE
+
+    def update(self, game, current_time, dt_ms):
         """Update trap state and damage zombies."""
-        current_time = pygame.time.get_ticks()
-
-        # Update cooldown
-        if self.cooldown > 0:
-            if current_time >= self.cooldown:
-                self.cooldown = 0
-                self.draw_trap()
-
-        # Check for zombie collisions
-        if self.is_active and self.cooldown == 0:
-            for zombie in game.zombies:
+        # Skip the whole collision scan while on cooldown
+        if self.cooldown > current_time:
+            return
+        elif self.cooldown:
+            self.cooldown = 0
+            self.draw_trap()
+
+        # Check for zombie collisions, scanning only the grid cells
+        # around the trap instead of the whole zombie group
+        if self.is_active:
+            for zombie in game.zombie_hash.query_rect(self.rect):
                 if self.rect.colliderect(zombie.rect):
-                    # Apply damage (scaled by frame time)
-                    zombie.take_damage(self.damage / 60)  # Assuming 60 FPS
+                    # Apply damage scaled by the actual frame time
+                    zombie.take_damage(self.damage * dt_ms * 0.001)
                     self.cooldown = current_time + self.cooldown_time
                     self.draw_cooldown()
                     break
 
     def draw_cooldown(self):
-        """Draw the trap in cooldown state."""
-        self.image.fill((0, 0, 0, 0))  # Clear
-        pygame.draw.rect(
-            self.image, Colors.PANEL_BG, (0, 0, self.rect.width, self.rect.height)
-        )
-        # Draw retracted spikes
-        pygame.draw.rect(
-            self.image,
-            (150, 50, 50),
-            (5, 5, self.rect.width - 10, self.rect.height - 10),
-        )
+        """Show the cooldown-state sprite (rasterized once per class)."""
+        if SpikeTrap._IMG_COOLDOWN is None:
+            img = pygame.Surface((self.rect.width, self.rect.height)).convert()
+            pygame.draw.rect(
+                img, Colors.PANEL_BG, (0, 0, self.rect.width, self.rect.height)
+            )
+            # Draw retracted spikes
+            pygame.draw.rect(
+                img,
+                (150, 50, 50),
+                (5, 5, self.rect.width - 10, self.rect.height - 10),
+            )
+            SpikeTrap._IMG_COOLDOWN = img
+        self.image = SpikeTrap._IMG_COOLDOWN
 
 
 class SlowTrap(Structure):
+    # Visual-state sprites shared by every instance, rasterized once
+    _IMG_ACTIVE = None
+    _IMG_COOLDOWN = None
+
     def __init__(self, x, y):
         super().__init__(x, y, 40, 40, 100)  # 40x40 size, 100 health
         self.slow_factor = 0.5  # How much to slow zombies (0.5 = half speed)
+        self.inv_slow = 1.0 / self.slow_factor  # Restore factor, computed once
         self.slow_duration = 2000  # ms
         self.is_active = True
         self.cooldown = 0
@@ -81,52 +97,60 @@ class SlowTrap(Structure):
         self.draw_trap()
 
     def draw_trap(self):
-        """Draw the slow trap appearance."""
-        # Draw base
-        pygame.draw.rect(
-            self.image, Colors.PANEL_BG, (0, 0, self.rect.width, self.rect.height)
-        )
-
-        # Draw ice crystal pattern
-        color = (100, 150, 255)
-        # Center crystal
-        points = [
-            (self.rect.width // 2, 5),
-            (self.rect.width - 5, self.rect.height // 2),
-            (self.rect.width // 2, self.rect.height - 5),
-            (5, self.rect.height // 2),
-        ]
-        pygame.draw.polygon(self.image, color, points)
-        # Draw X pattern
-        pygame.draw.line(
-            self.image, color, (5, 5), (self.rect.width - 5, self.rect.height - 5), 2
-        )
-        pygame.draw.line(
-            self.image, color, (5, self.rect.height - 5), (self.rect.width - 5, 5), 2
-        )
-
-    def update(self, game):
+        """Show the active-state sprite (rasterized once per class)."""
+        if SlowTrap._IMG_ACTIVE is None:
+            img = pygame.Surface((self.rect.width, self.rect.height)).convert()
+            # Draw base
+            pygame.draw.rect(
+                img, Colors.PANEL_BG, (0, 0, self.rect.width, self.rect.height)
+            )
+
+            # Draw ice crystal pattern
+            color = (100, 150, 255)
+            # Center crystal
+            points = [
+                (self.rect.width // 2, 5),
+                (self.rect.width - 5, self.rect.height // 2),
+                (self.rect.width // 2, self.rect.height - 5),
+                (5, self.rect.height // 2),
+            ]
+            pygame.draw.polygon(img, color, points)
+            # Draw X pattern
+            pygame.draw.line(
+                img, color, (5, 5), (self.rect.width - 5, self.rect.height - 5), 2
+            )
+            pygame.draw.line(
+                img, color, (5, self.rect.height - 5), (self.rect.width - 5, 5), 2
+            )
+            SlowTrap._IMG_ACTIVE = img
+        self.image = SlowTrap._IMG_ACTIVE
+
+    def update(self, game, current_time, dt_ms):
         """Update trap state and slow zombies."""
-        current_time = pygame.time.get_ticks()
-
         # Update cooldown
         if self.cooldown > 0:
             if current_time >= self.cooldown:
                 self.cooldown = 0
                 self.draw_trap()
 
-        # Update slowed zombies
-        zombies_to_remove = []
-        for zombie, end_time in self.affected_zombies.items():
-            if current_time >= end_time:
-                zombie.speed /= self.slow_factor  # Restore speed
-                zombies_to_remove.append(zombie)
-        for zombie in zombies_to_remove:
-            del self.affected_zombies[zombie]
-
-        # Check for new zombie collisions
+        # Update slowed zombies: restore speed when the effect expires,
+        # and evict dead zombies too — killed-while-slowed zombies used
+        # to stay referenced in the dict forever
+        if self.affected_zombies:
+            expired = [
+                zombie
+                for zombie, end_time in self.affected_zombies.items()
+                if current_time >= end_time or zombie._dense_group is None
+            ]
+            for zombie in expired:
+                if zombie._dense_group is not None:
+                    zombie.speed *= self.inv_slow  # Restore speed
+                del self.affected_zombies[zombie]
+
+        # Check for new zombie collisions, scanning only the grid cells
+        # around the trap instead of the whole zombie group
         if self.is_active and self.cooldown == 0:
-            for zombie in game.zombies:
+            for zombie in game.zombie_hash.query_rect(self.rect):
                 if zombie not in self.affected_zombies and self.rect.colliderect(
                     zombie.rect
                 ):
@@ -138,14 +162,17 @@ class SlowTrap(Structure):
                     break
 
     def draw_cooldown(self):
-        """Draw the trap in cooldown state."""
-        self.image.fill((0, 0, 0, 0))  # Clear
-        pygame.draw.rect(
-            self.image, Colors.PANEL_BG, (0, 0, self.rect.width, self.rect.height)
-        )
-        # Draw inactive state
-        pygame.draw.rect(
-            self.image,
-            (100, 150, 255, 128),
-            (5, 5, self.rect.width - 10, self.rect.height - 10),
-        )
+        """Show the cooldown-state sprite (rasterized once per class)."""
+        if SlowTrap._IMG_COOLDOWN is None:
+            img = pygame.Surface((self.rect.width, self.rect.height)).convert()
+            pygame.draw.rect(
+                img, Colors.PANEL_BG, (0, 0, self.rect.width, self.rect.height)
+            )
+            # Draw inactive state
+            pygame.draw.rect(
+                img,
+                (100, 150, 255, 128),
+                (5, 5, self.rect.width - 10, self.rect.height - 10),
+            )
+            SlowTrap._IMG_COOLDOWN = img
+        self.image = SlowTrap._IMG_COOLDOWN
@@ -7,8 +7,55 @@ This module implements defensive turrets that automatically shoot at zombies.
 
 import pygame
 import math
+import numpy as np
 from .structure import Structure
 from ..weapons.weapon import Bullet
+from ..utils.targeting import find_targets
+
+
+def update_turrets(turrets, game, current_time):
+    """Batch-update a list of turrets with one vectorized targeting pass.
+
+    Gathers all turret positions and ranges into arrays and resolves
+    every turret's nearest in-range zombie with a single find_targets
+    call; aiming and shooting stay per-turret Python on the results.
+    """
+    if not turrets:
+        return
+    n = game._zombie_count
+    if n == 0:
+        for turret in turrets:
+            turret.target = None
+        return
+
+    count = len(turrets)
+    tx = np.fromiter((t.rect.centerx for t in turrets), dtype=np.int32, count=count)
+    ty = np.fromiter((t.rect.centery for t in turrets), dtype=np.int32, count=count)
+    range_sq = np.fromiter(
+        (t.range_sq for t in turrets), dtype=np.int32, count=count
+    )
+    targets = find_targets(tx, ty, range_sq, game._zx[:n], game._zy[:n])
+
+    for turret, idx in zip(turrets, targets):
+        turret.target = game._zombie_sprites[idx] if idx >= 0 else None
+        if turret.target:
+            # Aim with one sqrt instead of atan2 + cos/sin later
+            dx = turret.target.rect.centerx - turret.rect.centerx
+            dy = turret.target.rect.centery - turret.rect.centery
+            d = math.sqrt(dx * dx + dy * dy)
+            if d:
+                turret.dir_x = dx / d
+                turret.dir_y = dy / d
+        if (
+            turret.target
+            and current_time - turret.last_shot_time > 1000 / turret.fire_rate
+        ):
+            turret.angle = math.atan2(
+                turret.target.rect.centery - turret.rect.centery,
+                turret.target.rect.centerx - turret.rect.centerx,
+            )
+            turret.shoot(game)
+            turret.last_shot_time = current_time
 
 
 class Turret(Structure):
@@ -17,9 +64,14 @@ class Turret(Structure):
         self.damage = damage
         self.fire_rate = fire_rate  # Shots per second
         self.range = range
+        self.range_sq = range * range
         self.target = None
         self.last_shot_time = 0
         self.angle = 0
+        # Barrel direction as a cached unit vector; draw reuses it
+        # instead of reconstructing it with cos/sin every frame
+        self.dir_x = 1.0
+        self.dir_y = 0.0
         self.draw_turret()
 
     def draw_turret(self):
@@ -29,22 +81,25 @@ class Turret(Structure):
         # Draw barrel mount
         pygame.draw.circle(self.image, (80, 80, 80), (16, 16), 8)
 
-    def update(self, game):
+    def update(self, game, current_time, dt_ms):
         """Update turret state and shoot at zombies."""
-        current_time = pygame.time.get_ticks()
-
-        # Find nearest zombie in range
-        nearest_dist = float("inf")
+        # Find the nearest zombie in range with one vectorized pass over
+        # the game's cached position arrays; squared distances preserve
+        # ordering, so no per-zombie hypot/sqrt is needed
         self.target = None
-
-        for zombie in game.zombies:
-            dist = math.hypot(
-                zombie.rect.centerx - self.rect.centerx,
-                zombie.rect.centery - self.rect.centery,
-            )
-            if dist <= self.range and dist < nearest_dist:
-                nearest_dist = dist
-                self.target = zombie
+        n = game._zombie_count
+        if n:
+            dx = game._zx[:n] - self.rect.centerx
+            dy = game._zy[:n] - self.rect.centery
+            d2 = dx * dx + dy * dy
+            idx = int(np.argmin(d2))
+            if d2[idx] <= self.range_sq:
+                self.target = game._zombie_sprites[idx]
+                # Aim with one sqrt instead of atan2 + cos/sin later
+                d = math.sqrt(d2[idx])
+                if d:
+                    self.dir_x = dx[idx] / d
+                    self.dir_y = dy[idx] / d
 
         # Update angle and shoot if we have a target
         if self.target and current_time - self.last_shot_time > 1000 / self.fire_rate:
@@ -57,7 +112,9 @@ class Turret(Structure):
 
     def shoot(self, game):
         """Create a bullet and add it to the game."""
-        bullet = Bullet(self.rect.centerx, self.rect.centery, self.angle, self.damage)
+        bullet = Bullet.acquire(
+            self.rect.centerx, self.rect.centery, self.angle, self.damage
+        )
         game.bullets.add(bullet)
 
     def draw(self, screen, x, y):
@@ -65,25 +122,39 @@ class Turret(Structure):
         # Draw base sprite
         super().draw(screen, x, y)
 
-        # Draw barrel
+        # Draw barrel along the cached unit vector; no trig per frame
         barrel_length = 20
-        end_x = x + 16 + math.cos(self.angle) * barrel_length
-        end_y = y + 16 + math.sin(self.angle) * barrel_length
+        end_x = x + 16 + self.dir_x * barrel_length
+        end_y = y + 16 + self.dir_y * barrel_length
         pygame.draw.line(screen, (60, 60, 60), (x + 16, y + 16), (end_x, end_y), 4)
 
 
 class BasicTurret(Turret):
+    # Shared sprite, rasterized once for all instances
+    _IMG = None
+
     def __init__(self, x, y):
         super().__init__(x, y, damage=10, fire_rate=1, range=200)  # 1 shot per second
-        self.image.fill((50, 50, 200))  # Blue color
-        self.draw_turret()
+        if BasicTurret._IMG is None:
+            self.image.fill((50, 50, 200))  # Blue color
+            self.draw_turret()
+            BasicTurret._IMG = self.image
+        else:
+            self.image = BasicTurret._IMG
 
 
 class AdvancedTurret(Turret):
+    # Shared sprite, rasterized once for all instances
+    _IMG = None
+
     def __init__(self, x, y):
         super().__init__(x, y, damage=15, fire_rate=2, range=300)  # 2 shots per second
-        self.image.fill((100, 100, 255))  # Lighter blue
-        self.draw_turret()
+        if AdvancedTurret._IMG is None:
+            self.image.fill((100, 100, 255))  # Lighter blue
+            self.draw_turret()
+            AdvancedTurret._IMG = self.image
+        else:
+            self.image = AdvancedTurret._IMG
 
     def draw_turret(self):
         """Draw advanced turret with enhanced appearance."""
@@ -32,6 +32,8 @@ This class provides UI rendering utilities and theme management. It includes:
    - Gradients
 """
 
+import functools
+
 import pygame
 
 
@@ -54,7 +56,58 @@ class Colors:
     CASH = (195, 195, 65)  # Yellow
 
 
+@functools.lru_cache(maxsize=512)
+def _render_text(font, text, color):
+    """Render text through an LRU cache.
+
+    HUD labels repeat the same strings frame after frame; caching turns
+    each repeat SDL_ttf raster into a dict lookup.
+    """
+    return font.render(text, True, color)
+
+
+@functools.lru_cache(maxsize=256)
+def _wrap_text(text, font, max_width):
+    """Word-wrap text to max_width, returning a tuple of line strings.
+
+    Measures words with font.size instead of rendering them, and caches
+    the layout so repeated tooltips skip the wrapping pass entirely.
+    """
+    lines = []
+    current_line = []
+    current_width = 0
+
+    for word in text.split():
+        word_width = font.size(word + " ")[0]
+
+        if current_width + word_width > max_width:
+            lines.append(" ".join(current_line))
+            current_line = [word]
+            current_width = word_width
+        else:
+            current_line.append(word)
+            current_width += word_width
+
+    if current_line:
+        lines.append(" ".join(current_line))
+
+    return tuple(lines)
+
+
+# Fully rendered tooltip surfaces keyed by (text, font, padding, max_width)
+_TOOLTIP_CACHE = {}
+
+# Translucent panel surfaces keyed by (size, color, radius, alpha); the
+# HUD draws the same few panels every frame
+_PANEL_CACHE = {}
+
+
 class UIHelper:
+    @staticmethod
+    def clear_text_cache():
+        """Drop cached text renders, e.g. after a theme change."""
+        _render_text.cache_clear()
+
     @staticmethod
     def draw_text_box(
         surface,
@@ -80,7 +133,7 @@ class UIHelper:
             bg_color: Background color
             border_radius: Corner rounding
         """
-        text_surface = font.render(text, True, color)
+        text_surface = _render_text(font, text, color)
         text_rect = text_surface.get_rect()
         box_rect = pygame.Rect(
             x - padding,
@@ -144,12 +197,18 @@ class UIHelper:
             alpha: Transparency (0-255)
         """
         if alpha < 255:
-            # Create a surface with alpha
-            panel = pygame.Surface(rect.size, pygame.SRCALPHA)
-            panel_color = (*bg_color, alpha)
-            pygame.draw.rect(
-                panel, panel_color, panel.get_rect(), border_radius=border_radius
-            )
+            # Blit a cached translucent surface instead of allocating
+            # and rasterizing one per call
+            key = (rect.size, bg_color, border_radius, alpha)
+            panel = _PANEL_CACHE.get(key)
+            if panel is None:
+                panel = pygame.Surface(rect.size, pygame.SRCALPHA)
+                panel_color = (*bg_color, alpha)
+                pygame.draw.rect(
+                    panel, panel_color, panel.get_rect(), border_radius=border_radius
+                )
+                panel = panel.convert_alpha()
+                _PANEL_CACHE[key] = panel
             surface.blit(panel, rect)
         else:
             pygame.draw.rect(surface, bg_color, rect, border_radius=border_radius)
@@ -193,7 +252,7 @@ class UIHelper:
         )
 
         # Draw text
-        text_surface = font.render(text, True, text_color)
+        text_surface = _render_text(font, text, text_color)
         text_rect = text_surface.get_rect(center=rect.center)
         surface.blit(text_surface, text_rect)
 
@@ -212,37 +271,26 @@ class UIHelper:
             padding: Space around text
             max_width: Maximum tooltip width
         """
-        # Split text into lines based on max width
-        words = text.split()
-        lines = []
-        current_line = []
-        current_width = 0
-
-        for word in words:
-            word_surface = font.render(word + " ", True, Colors.TEXT)
-            word_width = word_surface.get_width()
-
-            if current_width + word_width > max_width:
-                lines.append(" ".join(current_line))
-                current_line = [word]
-                current_width = word_width
-            else:
-                current_line.append(word)
-                current_width += word_width
-
-        if current_line:
-            lines.append(" ".join(current_line))
-
-        # Calculate tooltip dimensions
-        line_height = font.get_linesize()
-        tooltip_height = line_height * len(lines) + padding * 2
-        tooltip_width = max_width + padding * 2
-
-        # Draw tooltip background
-        tooltip_rect = pygame.Rect(x, y, tooltip_width, tooltip_height)
-        pygame.draw.rect(surface, Colors.PANEL_BG, tooltip_rect, border_radius=5)
+        # Tooltips repeat across frames, so the whole surface (wrapped
+        # layout, background and text) is rendered once and cached
+        key = (text, font, padding, max_width)
+        tooltip = _TOOLTIP_CACHE.get(key)
+        if tooltip is None:
+            lines = _wrap_text(text, font, max_width)
+
+            # Calculate tooltip dimensions
+            line_height = font.get_linesize()
+            tooltip_height = line_height * len(lines) + padding * 2
+            tooltip_width = max_width + padding * 2
+
+            tooltip = pygame.Surface((tooltip_width, tooltip_height), pygame.SRCALPHA)
+            pygame.draw.rect(
+                tooltip, Colors.PANEL_BG, tooltip.get_rect(), border_radius=5
+            )
+            for i, line in enumerate(lines):
+                text_surface = font.render(line, True, Colors.TEXT)
+                tooltip.blit(text_surface, (padding, padding + i * line_height))
+            tooltip = tooltip.convert_alpha()
+            _TOOLTIP_CACHE[key] = tooltip
 
-        # Draw text lines
-        for i, line in enumerate(lines):
-            text_surface = font.render(line, True, Colors.TEXT)
-            surface.blit(text_surface, (x + padding, y + padding + i * line_height))
+        surface.blit(tooltip, (x, y))
@@ -0,0 +1,69 @@
+"""
+Dense Sprite Group
+----------------
+
+A list-backed sprite container for hot-path entity groups (bullets, zombies).
+
+`pygame.sprite.Group` keeps its sprites in a dict and re-hashes on every
+add/remove/iterate. For groups we iterate densely every frame, a plain list
+with O(1) swap-remove is cheaper. Sprites added here get a back-reference so
+their `kill()` can remove them from the group like a regular sprite group.
+"""
+
+import pygame
+
+
+class DenseGroup:
+    """List-backed sprite container with O(1) add and swap-remove."""
+
+    __slots__ = ("_items",)
+
+    def __init__(self):
+        self._items = []
+
+    def _add_one(self, sprite):
+        sprite._dense_index = len(self._items)
+        sprite._dense_group = self
+        self._items.append(sprite)
+
+    def add(self, *sprites):
+        """Add sprites or iterables of sprites, like pygame's Group.add."""
+        for sprite in sprites:
+            if isinstance(sprite, pygame.sprite.Sprite):
+                if getattr(sprite, "_dense_group", None) is not self:
+                    self._add_one(sprite)
+            else:
+                for s in sprite:
+                    if getattr(s, "_dense_group", None) is not self:
+                        self._add_one(s)
+
+    def remove(self, sprite):
+        """Remove a sprite by swapping the last item into its slot."""
+        if getattr(sprite, "_dense_group", None) is not self:
+            return
+        index = sprite._dense_index
+        last = self._items.pop()
+        if index < len(self._items):
+            self._items[index] = last
+            last._dense_index = index
+        sprite._dense_group = None
+
+    def sprites(self):
+        """Return a snapshot list of the contained sprites."""
+        return list(self._items)
+
+    def empty(self):
+        """Remove all sprites from the group."""
+        for sprite in self._items:
+            sprite._dense_group = None
+        self._items.clear()
+
+    def __iter__(self):
+        # Iterate a snapshot so callers may kill sprites mid-loop
+        return iter(self._items.copy())
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, sprite):
+        return getattr(sprite, "_dense_group", None) is self
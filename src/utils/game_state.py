@@ -1,8 +1,24 @@
-from enum import Enum
+class GameState:
+    """Game state constants.
+
+    Plain ints rather than an Enum: the main loop dispatches on the
+    current state every frame, and int equality is a native compare
+    while Enum equality goes through Python-level __eq__ dispatch.
+    Call sites keep reading GameState.PLAYING as before.
+    """
 
-class GameState(Enum):
     MENU = 1
     SHOPPING = 2
     PLAYING = 3
     PAUSED = 4
     GAME_OVER = 5
+
+
+# Readable names for logging/debugging, since ints don't carry one
+STATE_NAMES = {
+    GameState.MENU: "MENU",
+    GameState.SHOPPING: "SHOPPING",
+    GameState.PLAYING: "PLAYING",
+    GameState.PAUSED: "PAUSED",
+    GameState.GAME_OVER: "GAME_OVER",
+}
@@ -0,0 +1,79 @@
+"""
+Spatial Hash Grid
+-----------------
+
+Uniform-grid broad phase over sprite rect centers. The game rebuilds
+one grid from the zombie group each frame; structures then query only
+the cells near themselves instead of scanning every zombie on the map.
+"""
+
+
+class SpatialHash:
+    """Plain dict-backed uniform grid, rebuilt once per frame."""
+
+    __slots__ = ("cell", "_grid")
+
+    def __init__(self, cell=128):
+        self.cell = cell
+        self._grid = {}
+
+    def rebuild(self, sprites):
+        """Re-bucket every sprite by its rect center."""
+        self._grid.clear()
+        cell = self.cell
+        grid = self._grid
+        for sprite in sprites:
+            rect = sprite.rect
+            key = (rect.centerx // cell, rect.centery // cell)
+            bucket = grid.get(key)
+            if bucket is None:
+                grid[key] = [sprite]
+            else:
+                bucket.append(sprite)
+
+    def insert(self, sprite):
+        """Add a single sprite without a full rebuild."""
+        rect = sprite.rect
+        key = (rect.centerx // self.cell, rect.centery // self.cell)
+        self._grid.setdefault(key, []).append(sprite)
+
+    def query_rect(self, rect):
+        """Get sprites bucketed in the cells a rect overlaps.
+
+        Pads by one cell on each side so sprites bucketed by center in
+        a neighbouring cell still show up; the caller does the exact
+        rect test.
+        """
+        cell = self.cell
+        grid = self._grid
+        x0 = rect.left // cell - 1
+        x1 = rect.right // cell + 1
+        y0 = rect.top // cell - 1
+        y1 = rect.bottom // cell + 1
+        results = []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = grid.get((cx, cy))
+                if bucket:
+                    results.extend(bucket)
+        return results
+
+    def query(self, x, y, radius):
+        """Get sprites bucketed within radius of (x, y).
+
+        Returns every sprite whose cell intersects the query box; the
+        caller still does its own exact distance or rect test.
+        """
+        cell = self.cell
+        grid = self._grid
+        x0 = int(x - radius) // cell
+        x1 = int(x + radius) // cell
+        y0 = int(y - radius) // cell
+        y1 = int(y + radius) // cell
+        results = []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = grid.get((cx, cy))
+                if bucket:
+                    results.extend(bucket)
+        return results
@@ -0,0 +1,31 @@
+"""
+Turret Targeting Helpers
+------------------------
+
+Vectorized nearest-target resolution shared by the turret update pass.
+One call resolves every turret against every zombie, replacing the
+per-turret Python scans that used to dominate frames with many turrets.
+"""
+
+import numpy as np
+
+
+def find_targets(tx, ty, range_sq, zx, zy):
+    """Resolve each turret's nearest in-range zombie in one pass.
+
+    Args:
+        tx, ty: Turret center coordinates, shape (T,)
+        range_sq: Squared turret ranges, shape (T,)
+        zx, zy: Zombie center coordinates, shape (Z,)
+
+    Returns:
+        int32 array of length T holding the chosen zombie index per
+        turret, or -1 where no zombie is within range. Works on squared
+        distances throughout, so no square roots are taken.
+    """
+    dx = zx[np.newaxis, :] - tx[:, np.newaxis]
+    dy = zy[np.newaxis, :] - ty[:, np.newaxis]
+    d2 = dx * dx + dy * dy
+    idx = np.argmin(d2, axis=1)
+    best = d2[np.arange(tx.shape[0]), idx]
+    return np.where(best <= range_sq, idx, -1).astype(np.int32)
@@ -7,6 +7,64 @@ This module implements throwable weapons including grenades and molotovs.
 
 import pygame
 import math
+import numpy as np
+
+# Palette for molotov fire particles; particles store an index into it
+FIRE_COLORS = (
+    (255, 100, 0),  # Orange
+    (255, 50, 0),  # Red-orange
+    (255, 200, 0),  # Yellow
+)
+
+
+# Pre-rendered explosion discs keyed by (color, radius, alpha step);
+# alpha is quantized to 16 steps so a fading explosion cycles through a
+# handful of shared surfaces instead of allocating one per frame
+_EXPLOSION_CACHE = {}
+
+
+def _explosion_frame(color, radius, alpha):
+    step = alpha >> 4
+    key = (color, radius, step)
+    surf = _EXPLOSION_CACHE.get(key)
+    if surf is None:
+        surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (*color, step << 4), (radius, radius), radius)
+        surf = surf.convert_alpha()
+        _EXPLOSION_CACHE[key] = surf
+    return surf
+
+
+def update_grenades(grenades, current_time):
+    """Batch-update a grenade group with one fused NumPy position step.
+
+    In-flight grenades are gathered into arrays, moved with whole-array
+    ops and written back in one pass, so N grenades cost a handful of C
+    calls instead of N Python-level position updates. Exploded grenades
+    still run their own update for explosion expiry and fire particles.
+    """
+    moving = [g for g in grenades if not g.exploded]
+    count = len(moving)
+    if count:
+        x = np.fromiter((g.x for g in moving), dtype=np.float64, count=count)
+        y = np.fromiter((g.y for g in moving), dtype=np.float64, count=count)
+        step = np.fromiter((g.speed for g in moving), dtype=np.float64, count=count)
+        x += np.fromiter((g.dx for g in moving), dtype=np.float64, count=count) * step
+        y += np.fromiter((g.dy for g in moving), dtype=np.float64, count=count) * step
+        for i, g in enumerate(moving):
+            g.x = x[i]
+            g.y = y[i]
+            g.rect.x = int(x[i])
+            g.rect.y = int(y[i])
+            # Fused grenades (the thrown weapon kind) carry an absolute
+            # detonation time; timed grenades here have none
+            explode_at = getattr(g, "explode_at", None)
+            if explode_at is not None and current_time >= explode_at:
+                g.explode(current_time)
+
+    for g in grenades:
+        if g.exploded:
+            g.update(current_time)
 
 
 class Grenade(pygame.sprite.Sprite):
@@ -24,6 +82,29 @@ class Grenade(pygame.sprite.Sprite):
         self.explosion_time = None
         self.explosion_duration = 500  # ms
 
+    # Per-class cached shop/toolbar icon (see get_preview_image)
+    _preview_image = None
+
+    @classmethod
+    def get_preview_image(cls):
+        """Shared 32x32 preview icon, built once per class.
+
+        The shop, toolbar and drag ghost all blit the same pixels, so the
+        icon is drawn once, display-converted and RLE-flagged, then
+        cached on the class.
+        """
+        if cls.__dict__.get("_preview_image") is None:
+            preview = pygame.Surface((32, 32), pygame.SRCALPHA)
+            cls._draw_preview(preview)
+            preview = preview.convert_alpha()
+            preview.set_alpha(preview.get_alpha(), pygame.RLEACCEL)
+            cls._preview_image = preview
+        return cls.__dict__["_preview_image"]
+
+    @staticmethod
+    def _draw_preview(surface):
+        pygame.draw.circle(surface, (100, 100, 100), (16, 16), 8)
+
     def update(self, current_time):
         if not self.exploded:
             self.x += self.dx * self.speed
@@ -37,33 +118,30 @@ class Grenade(pygame.sprite.Sprite):
         self.exploded = True
         self.explosion_time = current_time
 
-    def draw(self, screen, x, y):
+    def draw(self, screen, x, y, now):
         if not self.exploded:
             pygame.draw.circle(screen, (100, 100, 100), (x + 5, y + 5), 5)
         else:
+            # Skip the whole effect when the blast area is off-screen
+            radius = self.explosion_radius
+            if (
+                x + radius < 0
+                or x - radius > screen.get_width()
+                or y + radius < 0
+                or y - radius > screen.get_height()
+            ):
+                return
+
             # Draw explosion effect
             alpha = int(
-                255
-                * (
-                    1
-                    - (pygame.time.get_ticks() - self.explosion_time)
-                    / self.explosion_duration
-                )
+                255 * (1 - (now - self.explosion_time) / self.explosion_duration)
             )
-            if alpha > 0:
-                explosion_surf = pygame.Surface(
-                    (self.explosion_radius * 2, self.explosion_radius * 2),
-                    pygame.SRCALPHA,
-                )
-                pygame.draw.circle(
-                    explosion_surf,
-                    (*self.get_explosion_color(), alpha),
-                    (self.explosion_radius, self.explosion_radius),
-                    self.explosion_radius,
-                )
+            if alpha >= 16:
+                # Blit the nearest pre-rendered alpha step; nothing is
+                # allocated or rasterized in the per-frame path
                 screen.blit(
-                    explosion_surf,
-                    (x - self.explosion_radius, y - self.explosion_radius),
+                    _explosion_frame(self.get_explosion_color(), radius, alpha),
+                    (x - radius, y - radius),
                 )
 
     def get_explosion_color(self):
@@ -71,16 +149,57 @@ class Grenade(pygame.sprite.Sprite):
 
 
 class MolotovGrenade(Grenade):
+    # Pre-rendered particle glow sprites keyed by (color, size); the
+    # few color/size combos repeat across thousands of particles
+    _GLOW_CACHE = {}
+
+    @classmethod
+    def _glow_sprite(cls, color, size):
+        key = (color, size)
+        surf = cls._GLOW_CACHE.get(key)
+        if surf is None:
+            surf = pygame.Surface((size * 4, size * 4), pygame.SRCALPHA)
+            center = (size * 2, size * 2)
+
+            # Draw outer glow
+            for radius in range(size * 2, size - 1, -1):
+                alpha = int(100 * (radius - size) / size)
+                pygame.draw.circle(surf, (*color, alpha), center, radius)
+
+            # Draw core
+            pygame.draw.circle(surf, color, center, size)
+            surf = surf.convert_alpha()
+            cls._GLOW_CACHE[key] = surf
+        return surf
+
     def __init__(self, x, y, dx, dy):
         super().__init__(x, y, dx, dy)
         self.explosion_radius = 80
         self.damage = 50  # Less immediate damage
         self.fire_duration = 5000  # Fire lasts 5 seconds
         self.fire_damage = 20  # Damage per second to zombies in fire
-        self.fire_particles = []
         self.last_particle_time = 0
         self.particle_spawn_delay = 100  # ms between particle spawns
 
+        # Fire particles as parallel arrays (struct-of-arrays); motion
+        # and aging run as whole-array ops instead of per-dict updates
+        self._fp_count = 0
+        cap = 64
+        self._fp_x = np.empty(cap, dtype=np.float32)
+        self._fp_y = np.empty(cap, dtype=np.float32)
+        self._fp_dx = np.empty(cap, dtype=np.float32)
+        self._fp_speed = np.empty(cap, dtype=np.float32)
+        self._fp_size = np.empty(cap, dtype=np.int32)
+        self._fp_life = np.empty(cap, dtype=np.int32)
+        self._fp_color = np.empty(cap, dtype=np.int32)
+
+    @staticmethod
+    def _draw_preview(surface):
+        # Draw bottle
+        pygame.draw.rect(surface, (200, 100, 50), (12, 12, 8, 12))
+        # Draw rag
+        pygame.draw.line(surface, (150, 150, 150), (16, 12), (16, 8), 2)
+
     def update(self, current_time):
         if not self.exploded:
             super().update(current_time)
@@ -91,103 +210,116 @@ class MolotovGrenade(Grenade):
                     self.spawn_fire_particles()
                     self.last_particle_time = current_time
 
-            # Update existing particles
-            for particle in self.fire_particles[:]:
-                particle["life"] -= 1
-                if particle["life"] <= 0:
-                    self.fire_particles.remove(particle)
-                else:
-                    particle["y"] -= particle["speed"]  # Fire rises
-                    particle["x"] += particle["dx"]
+            # Age, cull and move all particles with whole-array ops
+            n = self._fp_count
+            if n:
+                self._fp_life[:n] -= 1
+                alive = self._fp_life[:n] > 0
+                m = int(np.count_nonzero(alive))
+                if m != n:
+                    # Compact survivors to the front of each array
+                    for arr in (
+                        self._fp_x,
+                        self._fp_y,
+                        self._fp_dx,
+                        self._fp_speed,
+                        self._fp_size,
+                        self._fp_life,
+                        self._fp_color,
+                    ):
+                        arr[:m] = arr[:n][alive]
+                    self._fp_count = n = m
+                self._fp_y[:n] -= self._fp_speed[:n]  # Fire rises
+                self._fp_x[:n] += self._fp_dx[:n]
 
             if (
                 current_time - self.explosion_time > self.fire_duration
-                and not self.fire_particles
+                and self._fp_count == 0
             ):
                 self.kill()
 
     def spawn_fire_particles(self):
-        """Create new fire particles at random positions within the fire area."""
-        import random
-
-        for _ in range(5):
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(0, self.explosion_radius)
-            particle_x = self.x + math.cos(angle) * distance
-            particle_y = self.y + math.sin(angle) * distance
-            self.fire_particles.append(
-                {
-                    "x": particle_x,
-                    "y": particle_y,
-                    "dx": random.uniform(-0.5, 0.5),
-                    "speed": random.uniform(0.5, 1.5),
-                    "size": random.randint(3, 8),
-                    "life": random.randint(20, 40),
-                    "color": random.choice(
-                        [
-                            (255, 100, 0),  # Orange
-                            (255, 50, 0),  # Red-orange
-                            (255, 200, 0),  # Yellow
-                        ]
-                    ),
-                }
-            )
+        """Append a batch of fire particles within the fire area.
+
+        The whole batch is generated with vectorized RNG calls and
+        written into the next free array slots.
+        """
+        count = 5
+        n = self._fp_count
+        if n + count > self._fp_x.shape[0]:
+            new_cap = self._fp_x.shape[0] * 2
+            self._fp_x = np.resize(self._fp_x, new_cap)
+            self._fp_y = np.resize(self._fp_y, new_cap)
+            self._fp_dx = np.resize(self._fp_dx, new_cap)
+            self._fp_speed = np.resize(self._fp_speed, new_cap)
+            self._fp_size = np.resize(self._fp_size, new_cap)
+            self._fp_life = np.resize(self._fp_life, new_cap)
+            self._fp_color = np.resize(self._fp_color, new_cap)
 
-    def draw(self, screen, x, y):
+        sl = slice(n, n + count)
+        angles = np.random.uniform(0, 2 * math.pi, count)
+        distances = np.random.uniform(0, self.explosion_radius, count)
+        self._fp_x[sl] = self.x + np.cos(angles) * distances
+        self._fp_y[sl] = self.y + np.sin(angles) * distances
+        self._fp_dx[sl] = np.random.uniform(-0.5, 0.5, count)
+        self._fp_speed[sl] = np.random.uniform(0.5, 1.5, count)
+        self._fp_size[sl] = np.random.randint(3, 9, count)
+        self._fp_life[sl] = np.random.randint(20, 41, count)
+        self._fp_color[sl] = np.random.randint(0, len(FIRE_COLORS), count)
+        self._fp_count = n + count
+
+    def draw(self, screen, x, y, now):
         if not self.exploded:
             # Draw molotov bottle
             pygame.draw.rect(screen, (200, 100, 50), (x, y, 10, 15))
             # Draw rag
             pygame.draw.line(screen, (150, 150, 150), (x + 5, y), (x + 5, y - 5), 2)
         else:
+            # Skip the fire area and every particle blit when the whole
+            # effect is off-screen; particles drift, so pad the bounds
+            radius = self.explosion_radius
+            margin = radius + 64
+            if (
+                x + margin < 0
+                or x - margin > screen.get_width()
+                or y + margin < 0
+                or y - margin > screen.get_height()
+            ):
+                return
+
             # Draw fire area indicator
             alpha = min(
                 128,
-                int(
-                    128
-                    * (
-                        1
-                        - (pygame.time.get_ticks() - self.explosion_time)
-                        / self.fire_duration
-                    )
-                ),
+                int(128 * (1 - (now - self.explosion_time) / self.fire_duration)),
             )
-            if alpha > 0:
-                fire_area = pygame.Surface(
-                    (self.explosion_radius * 2, self.explosion_radius * 2),
-                    pygame.SRCALPHA,
-                )
-                pygame.draw.circle(
-                    fire_area,
-                    (255, 100, 0, alpha),
-                    (self.explosion_radius, self.explosion_radius),
-                    self.explosion_radius,
-                )
+            if alpha >= 16:
+                # Same pre-rendered alpha steps as the explosion flash
                 screen.blit(
-                    fire_area, (x - self.explosion_radius, y - self.explosion_radius)
+                    _explosion_frame((255, 100, 0), radius, alpha),
+                    (x - radius, y - radius),
                 )
 
-            # Draw fire particles
-            for particle in self.fire_particles:
-                screen_x = int(particle["x"] - self.x + x)
-                screen_y = int(particle["y"] - self.y + y)
-                size = particle["size"]
-                color = particle["color"]
-
-                # Draw particle with glow
-                glow_surf = pygame.Surface((size * 4, size * 4), pygame.SRCALPHA)
-                glow_center = (size * 2, size * 2)
-
-                # Draw outer glow
-                for radius in range(size * 2, size - 1, -1):
-                    alpha = int(100 * (radius - size) / (size))
-                    pygame.draw.circle(glow_surf, (*color, alpha), glow_center, radius)
-
-                # Draw core
-                pygame.draw.circle(glow_surf, color, glow_center, size)
-
-                # Position glow surface
-                screen.blit(glow_surf, (screen_x - size * 2, screen_y - size * 2))
+            # Draw fire particles from the shared glow sprites in one
+            # batched call; no surface allocation or circle rasterizing
+            # happens in the per-frame path
+            n = self._fp_count
+            if n:
+                glow = self._glow_sprite
+                base_x = x - self.x
+                base_y = y - self.y
+                sizes = self._fp_size
+                screen.fblits(
+                    [
+                        (
+                            glow(FIRE_COLORS[self._fp_color[i]], int(sizes[i])),
+                            (
+                                int(self._fp_x[i] + base_x) - 2 * int(sizes[i]),
+                                int(self._fp_y[i] + base_y) - 2 * int(sizes[i]),
+                            ),
+                        )
+                        for i in range(n)
+                    ]
+                )
 
     def get_explosion_color(self):
         return (255, 100, 0)  # Orange explosion
@@ -52,21 +52,167 @@ Combat Mechanics:
 import pygame
 import math
 import random
-from enum import Enum
-
-
-class WeaponType(Enum):
+import logging
+import numpy as np
+from collections import namedtuple
+from enum import IntEnum
+
+logger = logging.getLogger(__name__)
+
+# Shared generator for vectorized pellet spread draws
+_RNG = np.random.default_rng()
+
+# Pellets per shotgun shell
+_SHOTGUN_PELLETS = 6
+
+# Bullet visuals by damage tier: low (<20), medium (<40), high
+_BULLET_SIZES = (1, 1.5, 2)
+_BULLET_COLORS = ((255, 255, 150), (255, 255, 255), (255, 255, 200))
+_TRAIL_COLORS = ((255, 255, 150), (255, 255, 200), (255, 255, 100))
+
+# Half-degree cos/sin lookup tables; weapon drawing calls cos/sin many
+# times per frame with the same aim angle, and half-degree quantization
+# is invisible at gun-sprite scale
+_COS = [math.cos(math.radians(i * 0.5)) for i in range(720)]
+_SIN = [math.sin(math.radians(i * 0.5)) for i in range(720)]
+
+
+def _cs(angle):
+    """Return (cos, sin) for an angle in radians from the lookup tables."""
+    i = int(angle * 114.591559) % 720  # 720 / (2 * pi)
+    return _COS[i], _SIN[i]
+
+
+# Lazily built weapon sprites: each type's line art is rasterized once
+# facing east, and rotated copies are cached per whole degree so
+# Weapon.draw is a single blit instead of 2-8 draw.line calls per frame
+_WEAPON_BASE = {}
+_WEAPON_ROT_CACHE = {}
+_WEAPON_SPRITE_SIZE = 128
+
+
+def _weapon_sprite(weapon, angle):
+    deg = int(-math.degrees(angle)) % 360
+    key = (weapon.type, deg)
+    surf = _WEAPON_ROT_CACHE.get(key)
+    if surf is None:
+        base = _WEAPON_BASE.get(weapon.type)
+        if base is None:
+            base = pygame.Surface(
+                (_WEAPON_SPRITE_SIZE, _WEAPON_SPRITE_SIZE), pygame.SRCALPHA
+            )
+            half = _WEAPON_SPRITE_SIZE // 2
+            weapon._draw_shape(base, half, half, 0.0)
+            base = base.convert_alpha()
+            _WEAPON_BASE[weapon.type] = base
+        surf = pygame.transform.rotate(base, deg).convert_alpha() if deg else base
+        _WEAPON_ROT_CACHE[key] = surf
+    return surf
+
+# Pre-rendered grenade explosion frames keyed by (radius, step); the
+# fade quantizes to 16 steps so a fading explosion cycles through
+# shared surfaces. Frames are colored copies of a per-radius radial
+# gradient mask, so generating one is a copy and a blended fill rather
+# than a stack of rasterized concentric circles
+_EXPLOSION_MASKS = {}
+_EXPLOSION_FRAMES = {}
+
+
+def _explosion_mask(radius):
+    mask = _EXPLOSION_MASKS.get(radius)
+    if mask is None:
+        yy, xx = np.ogrid[-radius:radius, -radius:radius]
+        factor = np.clip(1 - np.sqrt(xx * xx + yy * yy) / radius, 0, 1)
+        levels = (255 * factor).astype(np.uint8)
+        rgba = np.empty((radius * 2, radius * 2, 4), dtype=np.uint8)
+        rgba[..., 0] = levels
+        rgba[..., 1] = levels
+        rgba[..., 2] = levels
+        rgba[..., 3] = levels
+        mask = pygame.image.frombuffer(
+            rgba.tobytes(), (radius * 2, radius * 2), "RGBA"
+        ).convert_alpha()
+        _EXPLOSION_MASKS[radius] = mask
+    return mask
+
+
+def _explosion_frame(radius, step):
+    key = (radius, step)
+    surf = _EXPLOSION_FRAMES.get(key)
+    if surf is None:
+        alpha = int(255 * (1 - step / 16))
+        surf = _explosion_mask(radius).copy()
+        surf.fill((255, 165, 0, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+        _EXPLOSION_FRAMES[key] = surf
+    return surf
+
+
+def update_bullets(bullets):
+    """Advance every live bullet with one fused NumPy position step.
+
+    Positions and velocities are gathered into arrays, stepped with
+    whole-array adds and written back in a single pass — the same
+    gather/step/scatter batching the grenade and turret updates use —
+    so N bullets cost a few C calls instead of N Python updates.
+    """
+    count = len(bullets)
+    if not count:
+        return
+    x = np.fromiter((b.x for b in bullets), dtype=np.float64, count=count)
+    y = np.fromiter((b.y for b in bullets), dtype=np.float64, count=count)
+    x += np.fromiter((b.dx for b in bullets), dtype=np.float64, count=count)
+    y += np.fromiter((b.dy for b in bullets), dtype=np.float64, count=count)
+    for i, b in enumerate(bullets):
+        b.x = x[i]
+        b.y = y[i]
+        center = (int(x[i]), int(y[i]))
+        b.rect.center = center
+        b.collision_rect.center = center
+
+
+class WeaponType(IntEnum):
     """
     Defines the available weapon types and their base characteristics.
     Each type has unique properties affecting damage, fire rate, and effects.
+
+    IntEnum so the per-shot/per-frame type comparisons are native int
+    compares rather than Enum __eq__ dispatch.
     """
 
-    KNIFE = "knife"
-    PISTOL = "pistol"
-    ASSAULT_RIFLE = "assault_rifle"
-    SHOTGUN = "shotgun"
-    SMG = "smg"
-    BATTLE_RIFLE = "battle_rifle"
+    KNIFE = 0
+    PISTOL = 1
+    ASSAULT_RIFLE = 2
+    SHOTGUN = 3
+    SMG = 4
+    BATTLE_RIFLE = 5
+
+
+_WeaponStats = namedtuple(
+    "_WeaponStats",
+    (
+        "damage",
+        "fire_rate",  # seconds between shots
+        "reload_time",  # seconds (per shell for the shotgun)
+        "ammo_capacity",
+        "bullet_speed",
+        "reload_stages",
+        "auto",
+        "range",
+        "base_spread",
+    ),
+)
+
+# Per-type weapon tuning, replacing a branch chain per construction.
+# Shotgun damage is per pellet; it loads shells one by one. The knife
+# is melee: no ammo, no bullets.
+_WEAPON_STATS = {
+    WeaponType.PISTOL: _WeaponStats(10, 0.7, 1.2, 12, 12, 1, False, 250, 0.05),
+    WeaponType.SHOTGUN: _WeaponStats(16, 1.5, 0.6, 6, 10, 6, False, 50, 0.2),
+    WeaponType.SMG: _WeaponStats(10, 0.6, 1.8, 30, 14, 1, True, 100, 0.15),
+    WeaponType.ASSAULT_RIFLE: _WeaponStats(20, 0.9, 2.2, 25, 25, 2, True, 200, 0.08),
+    WeaponType.BATTLE_RIFLE: _WeaponStats(40, 1.5, 2.5, 10, 35, 2, False, 400, 0.03),
+    WeaponType.KNIFE: _WeaponStats(50, 0.5, 0, None, 0, 0, False, 25, 0.0),
+}
 
 
 class Bullet(pygame.sprite.Sprite):
@@ -81,6 +227,15 @@ class Bullet(pygame.sprite.Sprite):
         - Visual effects (glow, trails)
     """
 
+    # Rotated bullet sprites shared across instances, keyed by
+    # (size, color, angle bucket). Angles quantize to 6-degree steps,
+    # so a burst of same-weapon bullets reuses a handful of surfaces
+    # instead of allocating and rotating one each
+    _IMAGE_CACHE = {}
+
+    # Free-list of dead bullets awaiting reuse (see acquire)
+    _pool = []
+
     def __init__(self, x, y, angle, damage=10, bullet_speed=15, game=None):
         """Initialize a bullet with position, angle, damage, and speed.
 
@@ -93,91 +248,94 @@ class Bullet(pygame.sprite.Sprite):
             game (Game, optional): Reference to game instance. Defaults to None.
         """
         super().__init__()
+        # Positioned by _reinit; only the 4x4 size matters here
+        self.collision_rect = pygame.Rect(0, 0, 4, 4)
+        self.length = 20  # Length of the bullet line
+        self._reinit(x, y, angle, damage, bullet_speed, game)
+
+    @classmethod
+    def acquire(cls, x, y, angle, damage=10, bullet_speed=15, game=None):
+        """Get a bullet from the free-list, constructing only when empty.
+
+        Dead bullets park themselves in the pool from kill(), so
+        sustained fire reuses the same objects instead of allocating
+        and garbage-collecting one per shot.
+        """
+        if cls._pool:
+            bullet = cls._pool.pop()
+            bullet._reinit(x, y, angle, damage, bullet_speed, game)
+            return bullet
+        return cls(x, y, angle, damage, bullet_speed, game)
+
+    def _reinit(self, x, y, angle, damage, bullet_speed, game):
+        """Set all per-shot state; shared by __init__ and acquire."""
         self.game = game
-        self.size = self.get_size_from_damage(damage)
         self.x = float(x)
         self.y = float(y)
         self.angle = float(angle)  # Ensure angle is float
         self.damage = damage
-        self.dx = math.cos(self.angle) * bullet_speed
-        self.dy = math.sin(self.angle) * bullet_speed
-
-        # Colors
-        self.bullet_color = self.get_color_from_damage(damage)
-        self.trail_color = self.get_trail_color_from_damage(damage)
-
-        # Create collision rect
-        self.rect = pygame.Rect(x - 2, y - 2, 4, 4)
-        self.collision_rect = pygame.Rect(x - 2, y - 2, 4, 4)
-
-        # Create bullet surface
-        self.length = 20  # Length of the bullet line
-        self.base_image = pygame.Surface(
-            (self.length + 4, self.size * 4), pygame.SRCALPHA
-        )
-        self.draw_bullet()
-        self.image = pygame.transform.rotate(self.base_image, -math.degrees(self.angle))
+        # Table lookup instead of libm sin/cos; half-degree direction
+        # quantization is far below the weapons' random spread
+        c, s = _cs(self.angle)
+        self.dx = c * bullet_speed
+        self.dy = s * bullet_speed
+
+        # Size and colors by damage tier: low / medium / high
+        tier = (damage >= 20) + (damage >= 40)
+        self.size = _BULLET_SIZES[tier]
+        self.bullet_color = _BULLET_COLORS[tier]
+        self.trail_color = _TRAIL_COLORS[tier]
+
+        # Look up the shared pre-rotated sprite for this size/color/angle
+        deg = round(math.degrees(self.angle) / 6) * 6
+        key = (self.size, self.bullet_color, deg)
+        image = Bullet._IMAGE_CACHE.get(key)
+        if image is None:
+            base = pygame.Surface(
+                (self.length + 4, int(self.size * 4)), pygame.SRCALPHA
+            )
+            self.draw_bullet(base)
+            image = pygame.transform.rotate(base, -deg).convert_alpha()
+            Bullet._IMAGE_CACHE[key] = image
+        self.image = image
         self.rect = self.image.get_rect(center=(x, y))
-
-    def get_size_from_damage(self, damage):
-        """Return bullet size based on damage."""
-        if damage >= 40:  # High damage (e.g., sniper)
-            return 2
-        elif damage >= 20:  # Medium damage
-            return 1.5
-        else:  # Low damage
-            return 1
-
-    def get_color_from_damage(self, damage):
-        """Return bullet color based on damage."""
-        if damage >= 40:  # High damage weapons (e.g. sniper)
-            return (255, 255, 200)  # Bright yellow-white
-        elif damage >= 20:  # Medium damage (e.g. assault rifle)
-            return (255, 255, 255)  # Pure white
-        else:  # Low damage weapons
-            return (255, 255, 150)  # Light yellow
-
-    def get_trail_color_from_damage(self, damage):
-        """Return trail color based on damage."""
-        if damage >= 40:  # High damage weapons
-            return (255, 255, 100)  # Yellow trail
-        elif damage >= 20:  # Medium damage
-            return (255, 255, 200)  # Light yellow trail
-        else:  # Low damage weapons
-            return (255, 255, 150)  # Pale yellow trail
-
-    def update_collision_rect(self):
-        """Update the smaller collision rectangle position."""
         self.collision_rect.center = self.rect.center
 
+    def kill(self):
+        """Remove the bullet from its dense group and park it for reuse.
+
+        The dense-group membership doubles as the double-kill latch: a
+        bullet only enters the pool on the kill that actually removed
+        it, so repeated kills can't pool the same object twice.
+        """
+        group = getattr(self, "_dense_group", None)
+        if group is not None:
+            group.remove(self)
+            Bullet._pool.append(self)
+        super().kill()
+
     def update(self):
         """Update bullet position and trail."""
-        # Add trail effect if game reference exists
-        if self.game and hasattr(self.game, "particle_system"):
-            self.game.particle_system.create_bullet_trail(
-                self.x, self.y, self.angle, self.trail_color
-            )
-
+        # Trail particles are emitted by the game loop for every live
+        # bullet; emitting here as well doubled the particle load for
+        # player bullets
         # Update position
         self.x += self.dx
         self.y += self.dy
 
-        # Update rectangles
-        self.rect.centerx = int(self.x)
-        self.rect.centery = int(self.y)
-        self.collision_rect.center = self.rect.center
-
-        # Update bullet rotation
-        self.image = pygame.transform.rotate(self.base_image, -math.degrees(self.angle))
+        # Update rectangles with one computed center
+        center = (int(self.x), int(self.y))
+        self.rect.center = center
+        self.collision_rect.center = center
 
-    def draw_bullet(self):
+    def draw_bullet(self, surface):
         """Draw the bullet as a line with glow effect."""
         # Calculate line length based on bullet speed
         line_length = 10  # Fixed shorter length for consistency
 
         # Draw outer glow (wider line)
         pygame.draw.line(
-            self.base_image,
+            surface,
             (*self.bullet_color, 100),  # Semi-transparent
             (0, self.size),
             (line_length, self.size),
@@ -186,7 +344,7 @@ class Bullet(pygame.sprite.Sprite):
 
         # Draw core (thinner line)
         pygame.draw.line(
-            self.base_image,
+            surface,
             (*self.bullet_color, 255),  # Solid core
             (0, self.size),
             (line_length, self.size),
@@ -221,6 +379,9 @@ class Grenade(pygame.sprite.Sprite):
         self.explosion_duration = 500  # ms
         self.throw_time = pygame.time.get_ticks()
         self.fuse_time = 2000  # ms
+        # Absolute detonation time, computed once so fuse checks are a
+        # single compare instead of a subtraction per frame
+        self.explode_at = self.throw_time + self.fuse_time
 
     def update(self, current_time=None):
         """Update grenade position and check for explosion."""
@@ -235,7 +396,7 @@ class Grenade(pygame.sprite.Sprite):
             self.rect.y = int(self.y)
 
             # Check if fuse time is up
-            if current_time - self.throw_time >= self.fuse_time:
+            if current_time >= self.explode_at:
                 self.explode(current_time)
         elif current_time - self.explosion_time > self.explosion_duration:
             self.kill()
@@ -247,119 +408,56 @@ class Grenade(pygame.sprite.Sprite):
         self.exploded = True
         self.explosion_time = current_time
 
-    def draw(self, screen, x, y):
+    def draw(self, screen, x, y, now):
         """Draw the grenade and explosion effects."""
         if not self.exploded:
             # Draw grenade
             pygame.draw.circle(screen, (100, 100, 100), (x + 4, y + 4), 4)
         else:
-            # Draw explosion effect
-            current_time = pygame.time.get_ticks()
-            progress = (current_time - self.explosion_time) / self.explosion_duration
-            alpha = int(255 * (1 - progress))
-            if alpha > 0:
-                # Create explosion surface with transparency
-                explosion_surf = pygame.Surface(
-                    (self.explosion_radius * 2, self.explosion_radius * 2),
-                    pygame.SRCALPHA,
-                )
-
-                # Draw multiple circles for explosion effect
-                for radius in range(self.explosion_radius, 0, -10):
-                    color_factor = radius / self.explosion_radius
-                    color = (
-                        int(255 * color_factor),  # R
-                        int(165 * color_factor),  # G
-                        int(0),  # B
-                        int(alpha * color_factor),  # A
-                    )
-                    pygame.draw.circle(
-                        explosion_surf,
-                        color,
-                        (self.explosion_radius, self.explosion_radius),
-                        radius,
-                    )
-
-                # Draw the explosion
-                screen.blit(
-                    explosion_surf,
-                    (x - self.explosion_radius, y - self.explosion_radius),
-                )
+            # Blit the nearest pre-rendered explosion frame; no surface
+            # allocation or circle rasterization per frame
+            progress = (now - self.explosion_time) / self.explosion_duration
+            if progress < 1:
+                radius = self.explosion_radius
+                frame = _explosion_frame(radius, min(15, int(progress * 16)))
+                screen.blit(frame, (x - radius, y - radius))
 
 
 class Weapon:
     def __init__(self, weapon_type):
         self.type = weapon_type
         self.is_melee = weapon_type == WeaponType.KNIFE
-        self.last_shot_time = 0
+        # Earliest tick the weapon may fire again; one compare gates
+        # every shot attempt instead of a subtract-and-compare
+        self.next_shot_time = 0
         self.is_reloading = False
         self.reload_start_time = 0
         self.reload_stage = 0  # For multi-stage reloads
         self.has_fired_once = False  # Track if weapon has been fired
         self.game = None  # Will be set when weapon is equipped
 
-        # Weapon-specific properties
-        if self.type == WeaponType.PISTOL:
-            self.damage = 10
-            self.fire_rate = 0.7  # seconds between shots
-            self.reload_time = 1.2  # seconds
-            self.ammo_capacity = 12
-            self.bullet_speed = 12
-            self.reload_stages = 1
-            self.auto = False  # Semi-auto
-            self.range = 250  # Medium range (was 500)
-        elif self.type == WeaponType.SHOTGUN:
-            self.damage = 16  # per pellet
-            self.fire_rate = 1.5
-            self.reload_time = 0.6  # per shell
-            self.ammo_capacity = 6
-            self.bullet_speed = 10
-            self.reload_stages = 6  # Load shells one by one
-            self.auto = False  # Pump action
-            self.range = 50  # Short range (was 300)
-        elif self.type == WeaponType.SMG:
-            self.damage = 10
-            self.fire_rate = 0.6
-            self.reload_time = 1.8
-            self.ammo_capacity = 30
-            self.bullet_speed = 14
-            self.reload_stages = 1
-            self.auto = True  # Full auto
-            self.range = 100  # Medium range (was 400)
-        elif self.type == WeaponType.ASSAULT_RIFLE:
-            self.damage = 20
-            self.fire_rate = 0.9
-            self.reload_time = 2.2
-            self.ammo_capacity = 25
-            self.bullet_speed = 25
-            self.reload_stages = 2  # Magazine out, magazine in
-            self.auto = True  # Full auto
-            self.range = 200  # Long range (was 600)
-        elif self.type == WeaponType.BATTLE_RIFLE:
-            self.damage = 40
-            self.fire_rate = 1.5
-            self.reload_time = 2.5
-            self.ammo_capacity = 10
-            self.bullet_speed = 35
-            self.reload_stages = 2
-            self.auto = False  # Semi-auto
-            self.range = 400  # Very long range (was 800)
-        else:  # Knife
-            self.damage = 50
-            self.fire_rate = 0.5
-            self.reload_time = 0
-            self.ammo_capacity = None
-            self.bullet_speed = 0
-            self.reload_stages = 0
-            self.auto = False  # Manual swing
-            self.range = 25  # Very short melee range (was 50)
+        # Weapon-specific properties, one table lookup
+        stats = _WEAPON_STATS[self.type]
+        self.damage = stats.damage
+        self.fire_rate = stats.fire_rate
+        self.reload_time = stats.reload_time
+        self.ammo_capacity = stats.ammo_capacity
+        self.bullet_speed = stats.bullet_speed
+        self.reload_stages = stats.reload_stages
+        self.auto = stats.auto
+        self.range = stats.range
+        self.base_spread = stats.base_spread
+
+        # Integer-millisecond variants for per-check timing comparisons
+        self.fire_rate_ms = int(self.fire_rate * 1000)
+        self.reload_time_ms = int(self.reload_time * 1000)
 
         self.current_ammo = self.ammo_capacity
 
     def create_bullet(self, x, y, angle):
         """Create bullet(s) and mark weapon as fired."""
         if self.is_melee:
-            print("Melee weapon, no bullets")  # Debug
+            logger.debug("Melee weapon, no bullets")
             return []
 
         if self.current_ammo is not None:
@@ -368,39 +466,27 @@ class Weapon:
             self.current_ammo -= 1
             self.has_fired_once = True  # Mark as fired when bullet is created
 
-        # Get base spread for weapon type
-        if self.type == WeaponType.PISTOL:
-            base_spread = 0.05  # Small spread
-        elif self.type == WeaponType.SHOTGUN:
-            base_spread = 0.2  # Wide spread for pellets
-        elif self.type == WeaponType.SMG:
-            base_spread = 0.15  # Large spread due to rapid fire
-        elif self.type == WeaponType.ASSAULT_RIFLE:
-            base_spread = 0.08  # Moderate spread
-        elif self.type == WeaponType.BATTLE_RIFLE:
-            base_spread = 0.03  # Minimal spread, accurate
-        else:
-            base_spread = 0
+        # Base spread comes from the stats table
+        base_spread = self.base_spread
 
         if self.type == WeaponType.SHOTGUN:
-            # Create clustered spread for shotgun
-            bullets = []
-            num_pellets = 6
-            # Create a random central deviation
+            # Clustered spread: pellets deviate around a random central
+            # deviation, clamped to the base spread. All pellet angles
+            # are drawn and clamped in one vectorized RNG call
             center_deviation = random.uniform(-base_spread / 2, base_spread / 2)
-
-            for _ in range(num_pellets):
-                # Each pellet deviates from the center point
-                pellet_spread = random.gauss(center_deviation, base_spread / 3)
-                # Clamp spread to reasonable bounds
-                pellet_spread = max(-base_spread, min(base_spread, pellet_spread))
-                spread_angle = angle + pellet_spread
-
-                bullet = Bullet(
-                    x, y, spread_angle, self.damage, self.bullet_speed, self.game
+            spreads = _RNG.normal(center_deviation, base_spread / 3, _SHOTGUN_PELLETS)
+            np.clip(spreads, -base_spread, base_spread, out=spreads)
+            return [
+                Bullet.acquire(
+                    x,
+                    y,
+                    angle + spread,
+                    self.damage,
+                    self.bullet_speed,
+                    self.game,
                 )
-                bullets.append(bullet)
-            return bullets
+                for spread in spreads
+            ]
         else:
             # Single bullet with random spread
             spread = random.uniform(-base_spread, base_spread)
@@ -409,12 +495,12 @@ class Weapon:
                 spread *= 1.5  # Increase spread for sustained fire
 
             spread_angle = angle + spread
-            bullet = Bullet(
+            bullet = Bullet.acquire(
                 x, y, spread_angle, self.damage, self.bullet_speed, self.game
             )
             return [bullet]
 
-    def start_reload(self):
+    def start_reload(self, now=None):
         """Start or continue the reload process if conditions are met."""
         if (
             not self.is_melee
@@ -423,17 +509,17 @@ class Weapon:
             and self.current_ammo < self.ammo_capacity
         ):
             self.is_reloading = True
-            self.reload_start_time = pygame.time.get_ticks()
+            self.reload_start_time = pygame.time.get_ticks() if now is None else now
             self.reload_stage = 0
             if self.type in [WeaponType.ASSAULT_RIFLE, WeaponType.BATTLE_RIFLE]:
                 # These weapons empty the magazine first
                 self.current_ammo = 0
 
-    def continue_reload(self):
+    def continue_reload(self, now=None):
         """Continue to the next reload stage when player clicks."""
         if self.is_reloading:
-            current_time = pygame.time.get_ticks()
-            stage_duration = self.reload_time * 1000  # Time for current stage
+            current_time = pygame.time.get_ticks() if now is None else now
+            stage_duration = self.reload_time_ms  # Time for current stage
 
             # Check if enough time has passed for current stage
             if current_time - self.reload_start_time >= stage_duration:
@@ -456,11 +542,11 @@ class Weapon:
                     else:
                         self.reload_start_time = current_time
 
-    def update(self):
+    def update(self, now=None):
         """Update weapon state."""
         if self.is_reloading:
-            current_time = pygame.time.get_ticks()
-            stage_duration = self.reload_time * 1000
+            current_time = pygame.time.get_ticks() if now is None else now
+            stage_duration = self.reload_time_ms
 
             # Auto-cancel reload if taking too long
             if (
@@ -469,13 +555,12 @@ class Weapon:
                 self.is_reloading = False
                 self.reload_stage = 0
 
-    def get_reload_progress(self):
+    def get_reload_progress(self, now=None):
         """Get the current reload stage progress as a float between 0 and 1."""
         if not self.is_reloading:
             return 1.0
-        current_time = pygame.time.get_ticks()
-        stage_duration = self.reload_time * 1000
-        progress = (current_time - self.reload_start_time) / stage_duration
+        current_time = pygame.time.get_ticks() if now is None else now
+        progress = (current_time - self.reload_start_time) / self.reload_time_ms
         return min(1.0, progress)
 
     def finish_reload(self):
@@ -485,15 +570,13 @@ class Weapon:
             self.current_ammo = self.ammo_capacity
         self.reload_stage = 0
 
-    def can_shoot(self):
+    def can_shoot(self, now=None):
         """Check if the weapon can shoot based on fire rate and ammo."""
         if self.is_reloading:
             return False
 
-        current_time = pygame.time.get_ticks()
-        time_since_last_shot = (current_time - self.last_shot_time) / 1000.0
-
-        if time_since_last_shot < self.fire_rate:
+        current_time = pygame.time.get_ticks() if now is None else now
+        if current_time < self.next_shot_time:
             return False
 
         if self.current_ammo is not None and self.current_ammo <= 0:
@@ -514,7 +597,17 @@ class Weapon:
         return shake_values.get(self.type, 0.5)
 
     def draw(self, screen, x, y, angle):
-        """Draw the weapon with unique appearance for each type."""
+        """Draw the weapon as a cached pre-rotated sprite.
+
+        The per-type line art is rasterized once facing east, rotated
+        copies are cached per degree, and the per-frame cost is a
+        single centered blit.
+        """
+        surf = _weapon_sprite(self, angle)
+        screen.blit(surf, (x - surf.get_width() // 2, y - surf.get_height() // 2))
+
+    def _draw_shape(self, screen, x, y, angle):
+        """Rasterize the weapon's line art; only runs on cache misses."""
         if self.is_melee:
             # Draw knife as a line
             knife_length = 20
@@ -533,20 +626,22 @@ class Weapon:
             grip_length = 12
             grip_width = 6
 
+            c, s = _cs(angle)
+
             if self.type == WeaponType.PISTOL:
                 gun_length = 25
                 barrel_width = 3
                 # Draw slide
                 slide_length = 18
                 slide_height = 5
-                slide_x = x + math.cos(angle) * slide_length
-                slide_y = y + math.sin(angle) * slide_length
+                slide_x = x + c * slide_length
+                slide_y = y + s * slide_length
                 pygame.draw.line(
                     screen, (60, 60, 60), (x, y), (slide_x, slide_y), slide_height
                 )
                 # Draw barrel
-                barrel_x = x + math.cos(angle) * gun_length
-                barrel_y = y + math.sin(angle) * gun_length
+                barrel_x = x + c * gun_length
+                barrel_y = y + s * gun_length
                 pygame.draw.line(
                     screen, gun_color, (x, y), (barrel_x, barrel_y), barrel_width
                 )
@@ -556,12 +651,13 @@ class Weapon:
                 barrel_width = 5
                 # Draw double barrel
                 offset = 2
-                perp_x = math.cos(angle + math.pi / 2) * offset
-                perp_y = math.sin(angle + math.pi / 2) * offset
-                barrel1_end_x = x + math.cos(angle) * gun_length + perp_x
-                barrel1_end_y = y + math.sin(angle) * gun_length + perp_y
-                barrel2_end_x = x + math.cos(angle) * gun_length - perp_x
-                barrel2_end_y = y + math.sin(angle) * gun_length - perp_y
+                # cos(a + pi/2) = -sin(a), sin(a + pi/2) = cos(a)
+                perp_x = -s * offset
+                perp_y = c * offset
+                barrel1_end_x = x + c * gun_length + perp_x
+                barrel1_end_y = y + s * gun_length + perp_y
+                barrel2_end_x = x + c * gun_length - perp_x
+                barrel2_end_y = y + s * gun_length - perp_y
                 pygame.draw.line(
                     screen,
                     gun_color,
@@ -578,37 +674,37 @@ class Weapon:
                 )
                 # Draw pump
                 pump_length = 25
-                pump_x = x + math.cos(angle) * pump_length
-                pump_y = y + math.sin(angle) * pump_length
+                pump_x = x + c * pump_length
+                pump_y = y + s * pump_length
                 pygame.draw.line(screen, (100, 100, 100), (x, y), (pump_x, pump_y), 6)
 
             elif self.type == WeaponType.SMG:
                 gun_length = 30
                 # Draw compact body
-                body_x = x + math.cos(angle) * gun_length
-                body_y = y + math.sin(angle) * gun_length
+                body_x = x + c * gun_length
+                body_y = y + s * gun_length
                 pygame.draw.line(screen, gun_color, (x, y), (body_x, body_y), 4)
                 # Draw magazine well at an angle
-                mag_angle = angle + math.pi / 4
+                mag_c, mag_s = _cs(angle + math.pi / 4)
                 mag_length = 12
-                mag_x = x + math.cos(mag_angle) * mag_length
-                mag_y = y + math.sin(mag_angle) * mag_length
+                mag_x = x + mag_c * mag_length
+                mag_y = y + mag_s * mag_length
                 pygame.draw.line(screen, (70, 70, 70), (x, y), (mag_x, mag_y), 5)
 
             elif self.type == WeaponType.ASSAULT_RIFLE:
                 gun_length = 45
                 # Draw long barrel
-                barrel_x = x + math.cos(angle) * gun_length
-                barrel_y = y + math.sin(angle) * gun_length
+                barrel_x = x + c * gun_length
+                barrel_y = y + s * gun_length
                 pygame.draw.line(screen, gun_color, (x, y), (barrel_x, barrel_y), 3)
                 # Draw carry handle/sight
                 sight_length = 8
                 sight_offset = 15
-                sight_start_x = x + math.cos(angle) * sight_offset
-                sight_start_y = y + math.sin(angle) * sight_offset
-                sight_angle = angle - math.pi / 2
-                sight_end_x = sight_start_x + math.cos(sight_angle) * sight_length
-                sight_end_y = sight_start_y + math.sin(sight_angle) * sight_length
+                sight_start_x = x + c * sight_offset
+                sight_start_y = y + s * sight_offset
+                # cos(a - pi/2) = sin(a), sin(a - pi/2) = -cos(a)
+                sight_end_x = sight_start_x + s * sight_length
+                sight_end_y = sight_start_y - c * sight_length
                 pygame.draw.line(
                     screen,
                     (50, 50, 50),
@@ -620,17 +716,17 @@ class Weapon:
             elif self.type == WeaponType.BATTLE_RIFLE:
                 gun_length = 50
                 # Draw long heavy barrel
-                barrel_x = x + math.cos(angle) * gun_length
-                barrel_y = y + math.sin(angle) * gun_length
+                barrel_x = x + c * gun_length
+                barrel_y = y + s * gun_length
                 pygame.draw.line(screen, gun_color, (x, y), (barrel_x, barrel_y), 4)
                 # Draw scope
                 scope_length = 12
                 scope_offset = 20
-                scope_start_x = x + math.cos(angle) * scope_offset
-                scope_start_y = y + math.sin(angle) * scope_offset
-                scope_angle = angle - math.pi / 2
-                scope_end_x = scope_start_x + math.cos(scope_angle) * scope_length
-                scope_end_y = scope_start_y + math.sin(scope_angle) * scope_length
+                scope_start_x = x + c * scope_offset
+                scope_start_y = y + s * scope_offset
+                # cos(a - pi/2) = sin(a), sin(a - pi/2) = -cos(a)
+                scope_end_x = scope_start_x + s * scope_length
+                scope_end_y = scope_start_y - c * scope_length
                 pygame.draw.line(
                     screen,
                     (40, 40, 40),
@@ -640,17 +736,17 @@ class Weapon:
                 )
                 # Draw bipod
                 bipod_length = 8
-                bipod_angle1 = angle + math.pi / 4
-                bipod_angle2 = angle - math.pi / 4
-                bipod_x = x + math.cos(angle) * gun_length
-                bipod_y = y + math.sin(angle) * gun_length
+                bipod1_c, bipod1_s = _cs(angle + math.pi / 4)
+                bipod2_c, bipod2_s = _cs(angle - math.pi / 4)
+                bipod_x = x + c * gun_length
+                bipod_y = y + s * gun_length
                 pygame.draw.line(
                     screen,
                     (60, 60, 60),
                     (bipod_x, bipod_y),
                     (
-                        bipod_x + math.cos(bipod_angle1) * bipod_length,
-                        bipod_y + math.sin(bipod_angle1) * bipod_length,
+                        bipod_x + bipod1_c * bipod_length,
+                        bipod_y + bipod1_s * bipod_length,
                     ),
                     2,
                 )
@@ -659,16 +755,16 @@ class Weapon:
                     (60, 60, 60),
                     (bipod_x, bipod_y),
                     (
-                        bipod_x + math.cos(bipod_angle2) * bipod_length,
-                        bipod_y + math.sin(bipod_angle2) * bipod_length,
+                        bipod_x + bipod2_c * bipod_length,
+                        bipod_y + bipod2_s * bipod_length,
                     ),
                     2,
                 )
 
             # Draw grip for all guns (except melee)
-            grip_angle = angle + math.pi * 3 / 4
-            grip_x = x + math.cos(grip_angle) * grip_length
-            grip_y = y + math.sin(grip_angle) * grip_length
+            grip_c, grip_s = _cs(angle + math.pi * 3 / 4)
+            grip_x = x + grip_c * grip_length
+            grip_y = y + grip_s * grip_length
             pygame.draw.line(screen, (40, 40, 40), (x, y), (grip_x, grip_y), grip_width)
 
     def set_game(self, game):